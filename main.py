@@ -5,7 +5,7 @@ Entry point for the application. Delegates all business logic to the controller.
 """
 from view.output_format import OutputFormat
 from view.ui import RetroCLI
-from view.keyboard import read_char
+from view.keyboard import read_char, keys_pending, keyboard_session
 from controller.converter_controller import ConverterController
 from domain.converters.pdf_converter import PDFConverter
 from domain.converters.epub_converter import EPubConverter
@@ -26,7 +26,9 @@ handlers = {
 }
 
 def main(ui=None):
-    ui = ui or RetroCLI(keyboard_reader=read_char)
+    ui = ui or RetroCLI(
+        keyboard_reader=read_char, keys_pending=keys_pending, keyboard_session=keyboard_session
+    )
     controller = ConverterController(
         ui,
         converters=converters,
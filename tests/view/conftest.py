@@ -0,0 +1,50 @@
+"""Shared fixtures and helpers for view tests."""
+
+import pytest
+from view.keyboard import (
+    UP_TOKEN,
+    DOWN_TOKEN,
+    ENTER_TOKEN,
+    SPACE_TOKEN,
+    BACKSPACE_TOKEN,
+    char_token,
+)
+
+
+# ============================================================================
+# Keyboard Mock Helper
+# ============================================================================
+
+_KEY_MAP = {
+    "UP": UP_TOKEN,
+    "DOWN": DOWN_TOKEN,
+    "ENTER": ENTER_TOKEN,
+    "SPACE": SPACE_TOKEN,
+    "BACKSPACE": BACKSPACE_TOKEN,
+}
+
+
+def _keyboard_from_string(input_str):
+    """Create a keyboard reader from a string representation.
+
+    Args:
+        input_str: String like "DOWN DOWN SPACE ENTER" or "q"
+
+    Returns:
+        A callable keyboard reader
+    """
+    sequence = tuple(
+        _KEY_MAP.get(token) or char_token(token)
+        for token in input_str.split()
+    )
+    return iter(sequence).__next__
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def keyboard_from_string():
+    """Provide the keyboard reader factory."""
+    return _keyboard_from_string
@@ -1,5 +1,7 @@
-from view.keyboard import read_char, KeyboardKey
-from unittest.mock import MagicMock
+import termios
+import tty
+from view.keyboard import read_char, keys_pending, keyboard_session, KeyboardKey, ENTER_TOKEN, UNKNOWN_TOKEN, UP_TOKEN, char_token
+from unittest.mock import MagicMock, patch
 
 def test_read_char_arrow_up(monkeypatch):
     seq = iter(["\x1b", "[", "A"])
@@ -90,6 +92,29 @@ def test_read_char_unknown_escapes(monkeypatch):
     token = read_char()
     assert token.key == KeyboardKey.UNKNOWN
 
+    # Case 3: parameterised CSI (PageUp) is consumed whole
+    seq = iter(["\x1b", "[", "5", "~", "x"])
+    monkeypatch.setattr("sys.stdin.read", lambda n: next(seq))
+    assert read_char().key == KeyboardKey.UNKNOWN
+    assert read_char() is char_token("x")
+
+    # Case 4: stream ends mid-sequence
+    seq = iter(["\x1b", "[", "1", ""])
+    monkeypatch.setattr("sys.stdin.read", lambda n: next(seq))
+    assert read_char().key == KeyboardKey.UNKNOWN
+
+
+def test_read_char_application_cursor_keys(monkeypatch):
+    monkeypatch.setattr("termios.tcgetattr", lambda fd: [])
+    monkeypatch.setattr("termios.tcsetattr", lambda fd, when, attr: None)
+    monkeypatch.setattr("tty.setraw", lambda fd: None)
+    monkeypatch.setattr("sys.stdin.fileno", lambda: 0)
+    seq = iter(["\x1b", "O", "A", "\x1b", "O", "B"])
+    monkeypatch.setattr("sys.stdin.read", lambda n: next(seq))
+
+    assert read_char().key == KeyboardKey.UP
+    assert read_char().key == KeyboardKey.DOWN
+
 
 def test_read_char_backspace_variants(monkeypatch):
     def mock_termios(*args, **kwargs):
@@ -112,3 +137,99 @@ def test_read_char_backspace_variants(monkeypatch):
     monkeypatch.setattr("sys.stdin.read", lambda n: "\b")
     token = read_char()
     assert token.key == KeyboardKey.BACKSPACE
+
+
+def test_read_char_returns_shared_tokens(monkeypatch):
+    monkeypatch.setattr("sys.stdin.fileno", lambda: 0)
+    monkeypatch.setattr("termios.tcgetattr", lambda fd: [])
+    monkeypatch.setattr("termios.tcsetattr", lambda fd, when, attr: None)
+    monkeypatch.setattr("tty.setraw", lambda fd: None)
+
+    monkeypatch.setattr("sys.stdin.read", lambda n: "\r")
+    assert read_char() is ENTER_TOKEN
+
+    seq = iter(["\x1b", "[", "C"])
+    monkeypatch.setattr("sys.stdin.read", lambda n: next(seq))
+    assert read_char() is UNKNOWN_TOKEN
+
+    monkeypatch.setattr("sys.stdin.read", lambda n: "Q")
+    token = read_char()
+    assert token.char == "q"
+    assert read_char() is token is char_token("Q")
+
+
+def test_keys_pending_polls_stdin_with_timeout(monkeypatch):
+    calls = []
+
+    def fake_select(rlist, wlist, xlist, timeout):
+        calls.append(timeout)
+        return (rlist if len(calls) == 1 else []), [], []
+
+    monkeypatch.setattr("select.select", fake_select)
+
+    assert keys_pending() is True
+    assert keys_pending(0.02) is False
+    assert calls == [0, 0.02]
+
+
+def test_keyboard_session_switches_mode_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr("sys.stdin.fileno", lambda: 0)
+    monkeypatch.setattr("sys.stdin.read", lambda n: "x")
+    monkeypatch.setattr("os.read", lambda fd, n: b"x")
+    monkeypatch.setattr("termios.tcgetattr", lambda fd: calls.append("get") or [0] * 7)
+    monkeypatch.setattr("termios.tcsetattr", lambda fd, when, attr: calls.append("set"))
+    monkeypatch.setattr("tty.setcbreak", lambda fd, when: calls.append("cbreak"))
+    monkeypatch.setattr("tty.setraw", lambda fd: calls.append("raw"))
+
+    with keyboard_session():
+        with keyboard_session():
+            assert read_char().char == "x"
+        assert read_char().char == "x"
+
+    assert calls == ["get", "cbreak", "get", "set", "set"]
+    read_char()
+    assert calls[5:] == ["get", "raw", "set"]
+
+
+def test_keyboard_session_keeps_signal_keys_and_flow_control_off(monkeypatch):
+    original = [termios.IXON | termios.ICRNL, 0, 0, termios.ISIG | termios.ECHO, 0, 0, []]
+    applied = []
+    monkeypatch.setattr("sys.stdin.fileno", lambda: 0)
+    monkeypatch.setattr("termios.tcgetattr", lambda fd: list(original))
+    monkeypatch.setattr("termios.tcsetattr", lambda fd, when, attr: applied.append(attr))
+    monkeypatch.setattr("tty.setcbreak", lambda fd, when: None)
+    monkeypatch.setattr("os.read", lambda fd, n: b"\x03")
+
+    with keyboard_session():
+        assert read_char() is char_token("\x03")
+        session_mode = applied[-1]
+
+    assert session_mode[tty.IFLAG] == termios.ICRNL
+    assert session_mode[tty.LFLAG] == termios.ECHO
+    assert applied[-1] == original
+
+
+def test_keyboard_session_leaves_burst_keys_visible_to_keys_pending():
+    queue = bytearray("\x1b[Aé".encode())
+    stdin = MagicMock(encoding="utf-8")
+    stdin.fileno.return_value = 7
+
+    def read(fd, n):
+        assert (fd, n) == (7, 1)
+        byte = bytes(queue[:1])
+        del queue[:1]
+        return byte
+
+    def select(rlist, wlist, xlist, timeout):
+        return (rlist if queue else []), [], []
+
+    with patch("sys.stdin", stdin), patch("os.read", side_effect=read), \
+            patch("select.select", side_effect=select), patch("tty.setcbreak"), \
+            patch("termios.tcgetattr", return_value=[0] * 7), patch("termios.tcsetattr"):
+        with keyboard_session():
+            assert read_char() is UP_TOKEN
+            assert keys_pending()
+            assert read_char() is char_token("é")
+            assert not keys_pending()
+            assert read_char() is char_token("")
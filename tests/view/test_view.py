@@ -1,11 +1,19 @@
+import io
+import re
+import os
 import pytest
 import time
 from collections import defaultdict
 from pathlib import Path
 from contextlib import contextmanager
-from unittest.mock import Mock, MagicMock, patch
+from dataclasses import dataclass
+from functools import partial
+from unittest.mock import Mock, patch
 
+from rich.cells import cell_len
 from rich.console import Console
+from rich.live import Live
+from rich.panel import Panel
 from rich.text import Text
 
 from view.merge_mode import MergeMode
@@ -15,40 +23,32 @@ from view.ui import (
     StyledPercentageColumn,
     StyledDescriptionColumn,
     _StyledTimeMixin,
+    SYNC_BEGIN,
+    SYNC_END,
+    ERASE_BELOW,
+    FRAME_INTERVAL,
 )
 from view.output_format import OutputFormat
 from view.interface import ActionResult, ActionKind
-from view.keyboard import KeyboardToken, KeyboardKey
+from view.keyboard import KeyboardToken, KeyboardKey, DOWN_TOKEN, ENTER_TOKEN
 
 from domain.model.file import File
 from domain.adapters.file_factories import file_from_path
 from controller.workflow.state_machine import WorkflowState
 
+_PT, _MD, _JSON = OutputFormat.PLAIN_TEXT, OutputFormat.MARKDOWN, OutputFormat.JSON
+_NM, _M, _PP = MergeMode.NO_MERGE, MergeMode.MERGE, MergeMode.PER_PAGE
 
-# ===== Keyboard Mock Helper =====
 
-def keyboard_from_string(input_str):
-    """Create a keyboard reader from a string representation.
-    Args:
-        input_str: String like "DOWN DOWN SPACE ENTER" or "q"
-    
-    Returns:
-        A callable keyboard reader
-    """
-    key_map = {
-        "UP": KeyboardToken(KeyboardKey.UP),
-        "DOWN": KeyboardToken(KeyboardKey.DOWN),
-        "ENTER": KeyboardToken(KeyboardKey.ENTER),
-        "SPACE": KeyboardToken(KeyboardKey.SPACE),
-        "BACKSPACE": KeyboardToken(KeyboardKey.BACKSPACE),
-    }
-    
-    sequence = []
-    for token in input_str.split():
-        sequence.append(key_map.get(token, KeyboardToken(KeyboardKey.CHAR, token.lower())))
-        
-    iterator = iter(sequence)
-    return lambda: next(iterator)
+# ===== Progress Task Stub =====
+
+@dataclass(slots=True)
+class _FakeTask:
+    """Minimal stand-in for a Rich progress Task."""
+    id: int = 0
+    fields: dict | None = None
+    elapsed: float | None = None
+    percentage: float | None = None
 
 
 # ===== Time Provider Mock Helper =====
@@ -62,8 +62,61 @@ def time_provider_sequence(*times):
     Returns:
         A callable time provider that returns the next time value
     """
-    iterator = iter(times)
-    return lambda: next(iterator)
+    if len(times) == 1:
+        return lambda _v=times[0]: _v
+    return iter(times).__next__
+
+
+# ===== Console Helper =====
+
+def _header_box(console):
+    """Left offset and width of the last header box recorded on the console."""
+    line = [line for line in console.export_text().splitlines() if "┏" in line][-1]
+    left = line.index("┏")
+    return left, line.index("┓") + 1 - left
+
+
+def _file_row_frames(console):
+    """Cursor and checkbox of each recorded file row, grouped into three-row frames."""
+    marks = ["".join(m) for m in re.findall(r"([► ]) ([❏✔]) file\d\.pdf", console.export_text())]
+    return [tuple(marks[i:i + 3]) for i in range(0, len(marks), 3)]
+
+
+def _record_console():
+    """Recording console that skips terminal and color-system detection."""
+    return Console(
+        record=True,
+        color_system=None,
+        force_terminal=True,
+        width=120,
+        legacy_windows=False,
+        file=io.StringIO(),
+    )
+
+
+# ===== Shared UI Fixtures =====
+
+@pytest.fixture(scope="module")
+def shared_ui():
+    """A single RetroCLI reused by tests that only render or query it."""
+    return RetroCLI(console=_record_console())
+
+
+@pytest.fixture
+def ui(shared_ui):
+    """The shared RetroCLI with its console record buffer emptied."""
+    shared_ui.console.export_text(clear=True)
+    return shared_ui
+
+
+@pytest.fixture
+def ui_factory(shared_ui):
+    """Build a RetroCLI with a given keyboard reader on the shared console, record buffer emptied."""
+    shared_ui.console.export_text(clear=True)
+
+    def _build(keyboard_reader):
+        return RetroCLI(console=shared_ui.console, keyboard_reader=keyboard_reader)
+    return _build
 
 
 class TestRetroCLIBasics:
@@ -82,7 +135,7 @@ class TestRetroCLIBasics:
     
     def test_init_custom_console(self):
         """Test initialization with custom console"""
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console, max_width=100)
         
         assert ui.console is console
@@ -97,17 +150,138 @@ class TestRetroCLIBasics:
         assert ui.colors["custom"] == "#00ff00"
         # Default colors should still exist
         assert "primary" in ui.colors
+
+    def test_default_colors_are_shared_and_read_only(self):
+        """Overrides go into the instance's own dict and leave the class defaults intact"""
+        ui = RetroCLI(colors={"primary": "#000000"})
+
+        assert RetroCLI._DEFAULT_COLORS["primary"] == "#e9d8ff"
+        assert ui.colors["primary"] == "#000000"
+        with pytest.raises(TypeError):
+            RetroCLI._DEFAULT_COLORS["primary"] = "#000000"
     
-    def test_print_center(self):
-        """Test centered printing"""
-        console = Console(record=True)
+    def test_panel_width_follows_terminal_resize(self):
+        """Cached widths refresh when a new frame starts after a resize"""
+        console = _record_console()
+        ui = RetroCLI(console=console, max_width=100)
+
+        ui.clear_and_show_header()
+        assert ui.panel_width == 100
+        assert _header_box(console) == (10, 100)
+
+        console.width = 80
+        assert ui.panel_width == 100
+
+        ui.clear_and_show_header()
+        assert ui.panel_width == 80
+        assert _header_box(console) == (0, 80)
+
+    def test_hint_markup_is_parsed_once_across_resizes(self, keyboard_from_string):
+        """Hint panels rebuilt for a new width show the hints without parsing their markup again"""
+        console = _record_console()
+        ui = RetroCLI(console=console, keyboard_reader=keyboard_from_string("ENTER"))
+        files = [{"name": "a.pdf", "size": "1 KB"}, {"name": "b.pdf", "size": "2 KB"}]
+
+        console.width = 80
+        with patch.object(Text, "from_markup", side_effect=Text.from_markup) as from_markup:
+            ui.select_files(files)
+
+        assert not [c for c in from_markup.call_args_list if "navigate" in c.args[0]]
+        hint_rows = [line for line in console.export_text().splitlines() if "navigate" in line]
+        assert hint_rows and all(cell_len(line.rstrip()) == 80 for line in hint_rows)
+
+    def test_static_renderables_are_reused_when_width_returns(self):
+        """Resizing back to a recent width replays its header instead of rendering it again"""
+        console = _record_console()
+        console.width = 80
+        ui = RetroCLI(console=console, max_width=100)
+
+        def show_at(width):
+            console.width = width
+            ui.clear_and_show_header()
+            return _header_box(console)
+
+        def header_renders():
+            return sum(1 for c in render.call_args_list if c.args[0].subtitle)
+
+        with patch.object(Panel, "__rich_console__", autospec=True, side_effect=Panel.__rich_console__) as render:
+            assert show_at(80) == (0, 80)
+            assert show_at(60) == (0, 60)
+            assert header_renders() == 2
+
+            assert show_at(80) == (0, 80)
+            assert header_renders() == 2
+
+            for width in (70, 50, 40, 30):
+                show_at(width)
+            assert show_at(80) == (0, 80)
+            assert header_renders() == 7
+
+    def test_static_renderables_follow_a_new_max_width(self):
+        """Changing max_width rebuilds the panels even though the terminal width is unchanged"""
+        console = _record_console()
+        ui = RetroCLI(console=console, max_width=100)
+        ui.clear_and_show_header()
+        assert _header_box(console) == (10, 100)
+
+        ui.max_width = 80
+        ui.clear_and_show_header()
+
+        assert ui.panel_width == 80
+        assert _header_box(console) == (20, 80)
+
+    def test_panel_titles_are_parsed_once(self, ui):
+        """Repeated panel titles reuse one parsed Text"""
+        first = ui._create_panel("a", title="select files")
+        second = ui._create_panel("b", title="select files")
+
+        assert first.title is second.title
+        assert first.title.plain == "[select files]"
+
+    def test_static_panels_render_once_per_width(self):
+        """Hint panels replay cached segments until the render width changes"""
+        console = _record_console()
         ui = RetroCLI(console=console)
-        
+        hints = ui._radio_hint_panel
+        console.render = Mock(wraps=console.render)
+
+        console.print(hints)
+        console.print(hints)
+        first = console.export_text()
+        console.print(hints, width=80)
+
+        assert first.count("navigate") == 2
+        panel_renders = [c for c in console.render.call_args_list if c.args[0] is hints.renderable]
+        assert len(panel_renders) == 2
+
+    def test_print_center(self, ui):
+        """Test centered printing"""
         ui.print_center("Test content")
         
-        text = console.export_text()
+        text = ui.console.export_text()
         assert "Test content" in text
 
+    def test_clear_and_show_header_prints_one_frame(self):
+        """Header and breadcrumb are emitted through a single console.print"""
+        ui = RetroCLI(console=_record_console())
+        ui.console.print = Mock()
+
+        ui.clear_and_show_header()
+
+        ui.console.print.assert_called_once()
+
+    def test_frame_reaches_the_terminal_in_one_write(self):
+        """A composed frame is handed to the output file as a single write"""
+        ui = RetroCLI(console=_record_console())
+        ui.console.file = Mock(wraps=io.StringIO())
+
+        with ui._frame():
+            ui.print_center("first")
+            ui.print_center("second")
+
+        ui.console.file.write.assert_called_once()
+        ui.console.file.flush.assert_called_once()
+
 
 class TestProgressColumns:
     """Test custom progress column classes"""
@@ -116,8 +290,7 @@ class TestProgressColumns:
         """Test mixin render with valid value"""
         mixin = _StyledTimeMixin("cyan", "elapsed")
         
-        task = Mock()
-        task.elapsed = 125.5  # 2 minutes 5 seconds
+        task = _FakeTask(elapsed=125.5)  # 2 minutes 5 seconds
         
         result = mixin.render(task)
         assert "02:05" in str(result)
@@ -126,8 +299,7 @@ class TestProgressColumns:
         """Test mixin render with None value"""
         mixin = _StyledTimeMixin("cyan", "elapsed")
         
-        task = Mock()
-        task.elapsed = None
+        task = _FakeTask(elapsed=None)
         
         result = mixin.render(task)
         assert "00:00" in str(result)
@@ -155,14 +327,30 @@ class TestProgressColumns:
         assert mixin._format_time(3600) == "01:00:00"
         assert mixin._format_time(7265) == "02:01:05"
         assert mixin._format_time(36000) == "10:00:00"
-    
+        assert mixin._format_time(360000) == "100:00:00"
+
+    def test_styled_time_elapsed_column_reuses_each_tasks_text_within_a_second(self):
+        """Every task keeps its own Text while its whole second is unchanged, across ticks"""
+        column = StyledTimeElapsedColumn("cyan", time_provider=Mock(side_effect=[105.2, 105.8, 106.1]))
+        tasks = [
+            _FakeTask(id=0, fields={"status": "done", "conversion_time": 7.2}),
+            _FakeTask(id=1, fields={"status": "converting", "start_time": 100.0}),
+            _FakeTask(id=2, fields={"status": "pending"}),
+        ]
+
+        ticks = [[column.render(task) for task in tasks] for _ in range(3)]
+
+        assert [t.plain for t in ticks[0]] == ["00:07", "00:05", "00:00"]
+        assert all(a is b for a, b in zip(ticks[0], ticks[1]))
+        assert ticks[2][0] is ticks[0][0] and ticks[2][2] is ticks[0][2]
+        assert ticks[2][1].plain == "00:06"
+
     def test_styled_time_elapsed_column_pending(self):
         """Test time elapsed column with pending status"""
         column = StyledTimeElapsedColumn("cyan")
         
         # Create mock task
-        task = Mock()
-        task.fields = {"status": "pending", "filename": "test.pdf"}
+        task = _FakeTask(fields={"status": "pending", "filename": "test.pdf"})
         
         result = column.render(task)
         assert "00:00" in str(result)
@@ -174,12 +362,11 @@ class TestProgressColumns:
         column = StyledTimeElapsedColumn("cyan", time_provider=time_provider)
         
         # Create mock task with start time
-        task = Mock()
-        task.fields = {
+        task = _FakeTask(fields={
             "status": "converting",
             "filename": "test.pdf",
             "start_time": 100.0  # Started at time 100.0
-        }
+        })
         
         result = column.render(task)
         # Should show 5 seconds (105.0 - 100.0 = 5.0)
@@ -190,12 +377,11 @@ class TestProgressColumns:
         column = StyledTimeElapsedColumn("cyan")
         
         # Create mock task
-        task = Mock()
-        task.fields = {
+        task = _FakeTask(fields={
             "status": "done",
             "filename": "test.pdf",
             "conversion_time": 12.5
-        }
+        })
         
         result = column.render(task)
         assert "00:12" in str(result)
@@ -204,8 +390,7 @@ class TestProgressColumns:
         """Test time elapsed column with no fields"""
         column = StyledTimeElapsedColumn("cyan")
         
-        task = Mock()
-        task.fields = None
+        task = _FakeTask(fields=None)
         
         result = column.render(task)
         assert "00:00" in str(result)
@@ -215,9 +400,7 @@ class TestProgressColumns:
         colors = {"confirm": "green", "accented": "cyan"}
         column = StyledPercentageColumn(colors)
         
-        task = Mock()
-        task.percentage = 45.0
-        task.fields = {"status": "converting"}
+        task = _FakeTask(percentage=45.0, fields={"status": "converting"})
         
         result = column.render(task)
         assert "45%" in str(result)
@@ -227,9 +410,7 @@ class TestProgressColumns:
         colors = {"confirm": "green", "accented": "cyan"}
         column = StyledPercentageColumn(colors)
         
-        task = Mock()
-        task.percentage = 100.0
-        task.fields = {"status": "done"}
+        task = _FakeTask(percentage=100.0, fields={"status": "done"})
         
         result = column.render(task)
         assert "100%" in str(result)
@@ -239,8 +420,7 @@ class TestProgressColumns:
         colors = {"confirm": "green", "accented": "cyan", "subtle": "grey"}
         column = StyledDescriptionColumn(colors)
         
-        task = Mock()
-        task.fields = {"status": "pending", "filename": "test.pdf"}
+        task = _FakeTask(fields={"status": "pending", "filename": "test.pdf"})
         
         result = column.render(task)
         assert "test.pdf" in str(result)
@@ -250,8 +430,7 @@ class TestProgressColumns:
         colors = {"confirm": "green", "accented": "cyan", "subtle": "grey"}
         column = StyledDescriptionColumn(colors)
         
-        task = Mock()
-        task.fields = {"status": "converting", "filename": "document.epub"}
+        task = _FakeTask(fields={"status": "converting", "filename": "document.epub"})
         
         result = column.render(task)
         assert "converting" in str(result).lower()
@@ -262,78 +441,167 @@ class TestProgressColumns:
         colors = {"confirm": "green", "accented": "cyan", "subtle": "grey"}
         column = StyledDescriptionColumn(colors)
         
-        task = Mock()
-        task.fields = {"status": "done", "filename": "complete.pdf"}
+        task = _FakeTask(fields={"status": "done", "filename": "complete.pdf"})
         
         result = column.render(task)
         assert "complete.pdf" in str(result)
 
+    def test_styled_description_column_keeps_brackets_literal(self):
+        """Filenames are not parsed as markup"""
+        colors = {"confirm": "green", "accented": "cyan", "subtle": "grey"}
+        column = StyledDescriptionColumn(colors)
+
+        task = _FakeTask(fields={"status": "done", "filename": "[draft] notes.pdf"})
+
+        result = column.render(task)
+        assert result.plain == "✓ [draft] notes.pdf"
+        assert result.style == "green"
+
+    def test_progress_text_columns_reuse_text_until_the_value_changes(self):
+        """Unchanged percentage and description cells hand back the same Text"""
+        colors = {"confirm": "green", "accented": "cyan", "subtle": "grey"}
+        percentage = StyledPercentageColumn(colors)
+        description = StyledDescriptionColumn(colors)
+        task = _FakeTask(percentage=41.6, fields={"status": "converting", "filename": "a.pdf"})
+
+        first = percentage.render(task), description.render(task)
+        task.percentage = 42.2
+        assert percentage.render(task) is first[0]
+        assert description.render(task) is first[1]
+
+        task.fields = {"status": "done", "filename": "a.pdf"}
+        task.percentage = 100.0
+        assert percentage.render(task).plain == "100%"
+        assert percentage.render(task).style == "green"
+        assert description.render(task).plain == "✓ a.pdf"
+
 
 class TestDisplayMethods:
     """Test display and rendering methods"""
     
-    def test_draw_header(self):
+    def test_draw_header(self, ui):
         """Test header drawing"""
-        console = Console(record=True)
-        ui = RetroCLI(console=console)
-        
         ui.draw_header()
         
-        text = console.export_text()
+        text = ui.console.export_text()
         assert "VELLUM" in text or "epub" in text
     
-    def test_show_error(self):
+    def test_show_error(self, ui):
         """Test error message display"""
-        console = Console(record=True)
-        ui = RetroCLI(console=console)
-        
         ui.show_error("fatal error: file not found")
         
-        text = console.export_text()
+        text = ui.console.export_text()
         assert "fatal error" in text
     
-    def test_show_conversion_summary(self):
+    @pytest.mark.parametrize(
+        "summary_kwargs, expected",
+        [
+            (
+                dict(
+                    total_files=3,
+                    output_count=3,
+                    merge_mode=MergeMode.NO_MERGE,
+                    merged_filename=None,
+                    total_runtime=45.67,
+                    total_input_size_formatted="2.0MB",
+                    total_output_size_formatted="1.5MB",
+                ),
+                [
+                    "conversion complete",
+                    "files processed:     3",
+                    "output created:      3 files",
+                    "total runtime:       45.67s",
+                    "input size:          2.0MB",
+                ],
+            ),
+            (
+                dict(
+                    total_files=2,
+                    output_count=1,
+                    merge_mode=MergeMode.MERGE,
+                    merged_filename="combined.txt",
+                    total_runtime=12.34,
+                    total_input_size_formatted="1.0MB",
+                    total_output_size_formatted="800.0KB",
+                ),
+                [
+                    "output created:      1 merged file (combined.txt)",
+                    "total runtime:       12.34s",
+                    "input size:          1.0MB",
+                ],
+            ),
+            (
+                dict(
+                    total_files=1,
+                    output_count=5,
+                    merge_mode=MergeMode.PER_PAGE,
+                    merged_filename=None,
+                    total_runtime=8.90,
+                    total_input_size_formatted="500.0KB",
+                    total_output_size_formatted="300.0KB",
+                ),
+                [
+                    "output created:      5 pages/chapters",
+                    "total runtime:       8.90s",
+                    "input size:          500.0KB",
+                ],
+            ),
+            (
+                dict(
+                    total_files=1,
+                    output_count=1,
+                    merge_mode="no_merge",
+                    merged_filename=None,
+                    total_runtime=1.0,
+                    total_input_size_formatted="512B",
+                    total_output_size_formatted="256B",
+                ),
+                ["input size:          512B"],
+            ),
+            (
+                dict(
+                    total_files=1,
+                    output_count=1,
+                    merge_mode="no_merge",
+                    merged_filename=None,
+                    total_runtime=1.0,
+                    total_input_size_formatted="1.0TB",
+                    total_output_size_formatted="500.0GB",
+                ),
+                ["input size:          1.0TB"],
+            ),
+            (
+                dict(
+                    total_files=1,
+                    output_count=1,
+                    merge_mode=MergeMode.NO_MERGE,
+                    merged_filename=None,
+                    total_runtime=2.5,
+                    total_input_size_formatted="100.0KB",
+                    total_output_size_formatted="80.0KB",
+                    single_output_filename="document.txt",
+                ),
+                [
+                    "output created:      document.txt",
+                    "total runtime:       2.50s",
+                ],
+            ),
+        ],
+        ids=["no_merge", "merge", "per_page", "bytes", "terabytes", "single_file"],
+    )
+    def test_show_conversion_summary(self, ui, summary_kwargs, expected):
         """Test conversion summary display with different merge modes"""
-        console = Console(record=True)
-        ui = RetroCLI(console=console)
-        
-        # Test no_merge mode
-        ui.show_conversion_summary(
-            total_files=3,
-            output_count=3,
-            merge_mode=MergeMode.NO_MERGE,
-            merged_filename=None,
-            total_runtime=45.67,
-            total_input_size_formatted="2.0MB",
-            total_output_size_formatted="1.5MB"
-        )
-        
-        text = console.export_text()
-        assert "conversion complete" in text.lower()
-        assert "files processed:     3" in text
-        assert "output created:      3 files" in text
-        assert "total runtime:       45.67s" in text
-        assert "input size:          2.0MB" in text
-        # Keybinding hints moved to `ask_again()`; summary no longer contains them
-        
-        # Clear console for next test
-        console.clear()
-        
-        # Test merge mode
-        ui.show_conversion_summary(
-            total_files=2,
-            output_count=1,
-            merge_mode=MergeMode.MERGE,
-            merged_filename="combined.txt",
-            total_runtime=12.34,
-            total_input_size_formatted="1.0MB",
-            total_output_size_formatted="800.0KB"
-        )
-        
-        text = console.export_text()
-        assert "output created:      1 merged file (combined.txt)" in text
-        assert "total runtime:       12.34s" in text
-        assert "input size:          1.0MB" in text
+        ui.show_conversion_summary(**summary_kwargs)
+
+        lines = ui.console.export_text().splitlines()
+        for fragment in expected:
+            assert any(fragment in line for line in lines), fragment
+
+    def test_show_conversion_summary_prints_filename_literally(self, ui):
+        """Merged filenames are shown as-is rather than parsed as markup"""
+        ui.show_conversion_summary(2, 1, MergeMode.MERGE, "[draft] notes.md", 1.0, "1 KB", "1 KB")
+
+        assert "1 merged file ([draft] notes.md)" in ui.console.export_text()
 
 
 class TestSelectionMethods:
@@ -341,7 +609,7 @@ class TestSelectionMethods:
 
     def test_clear_and_show_header_without_breadcrumb_data(self):
         from unittest.mock import Mock
-        console = Console()
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.draw_breadcrumb = Mock()
         ui.clear_and_show_header()
@@ -349,7 +617,7 @@ class TestSelectionMethods:
 
     def test_select_output_format_back_returns_back_action(self):
         keyboard = lambda: KeyboardToken(KeyboardKey.BACKSPACE)
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console, keyboard_reader=keyboard)
 
         res = ui.select_output_format()
@@ -359,90 +627,17 @@ class TestSelectionMethods:
 
     def test_select_merge_mode_back_returns_back_action(self):
         keyboard = lambda: KeyboardToken(KeyboardKey.BACKSPACE)
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console, keyboard_reader=keyboard)
 
         res = ui.select_merge_mode()
         assert isinstance(res, ActionResult)
         assert res.kind == ActionKind.BACK
-        
-        # Clear console for next test
-        console.clear()
-        
-        # Test per_page mode
-        ui.show_conversion_summary(
-            total_files=1,
-            output_count=5,
-            merge_mode=MergeMode.PER_PAGE,
-            merged_filename=None,
-            total_runtime=8.90,
-            total_input_size_formatted="500.0KB",
-            total_output_size_formatted="300.0KB"
-        )
-        
-        text = console.export_text()
-        assert "output created:      5 pages/chapters" in text
-        assert "total runtime:       8.90s" in text
-        assert "input size:          500.0KB" in text
-        
-        # Clear console for next test
-        console.clear()
-        
-        # Test edge cases for file size formatting
-        # Test bytes (B) unit
-        ui.show_conversion_summary(
-            total_files=1,
-            output_count=1,
-            merge_mode="no_merge",
-            merged_filename=None,
-            total_runtime=1.0,
-            total_input_size_formatted="512B",
-            total_output_size_formatted="256B"
-        )
-        
-        text = console.export_text()
-        assert "input size:          512B" in text
-        
-        # Clear console for next test
-        console.clear()
-        
-        # Test terabytes (TB) unit
-        ui.show_conversion_summary(
-            total_files=1,
-            output_count=1,
-            merge_mode="no_merge",
-            merged_filename=None,
-            total_runtime=1.0,
-            total_input_size_formatted="1.0TB",
-            total_output_size_formatted="500.0GB"
-        )
-        
-        text = console.export_text()
-        assert "input size:          1.0TB" in text
-        
-        # Clear console for next test
-        console.clear()
-        
-        # Test single file no_merge with filename display
-        ui.show_conversion_summary(
-            total_files=1,
-            output_count=1,
-            merge_mode=MergeMode.NO_MERGE,
-            merged_filename=None,
-            total_runtime=2.5,
-            total_input_size_formatted="100.0KB",
-            total_output_size_formatted="80.0KB",
-            single_output_filename="document.txt"
-        )
-        
-        text = console.export_text()
-        assert "output created:      document.txt" in text
-        assert "total runtime:       2.50s" in text
 
-    def test_radio_select_q_terminates(self):
+    def test_radio_select_q_terminates(self, keyboard_from_string):
         # Use existing keyboard helper to simulate pressing 'q'
         keyboard = keyboard_from_string("q")
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console, keyboard_reader=keyboard)
 
         result = ui.select_output_format()
@@ -450,21 +645,39 @@ class TestSelectionMethods:
         assert result.kind == ActionKind.TERMINATE
 
 
-    def test_select_files_back_on_backspace(self):
+    def test_select_files_back_on_backspace(self, keyboard_from_string):
         # Use existing keyboard helper to simulate BACKSPACE
         keyboard = keyboard_from_string("BACKSPACE")
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console, keyboard_reader=keyboard)
 
-        file_data = {"name": "a.pdf", "size": "1KB"}
+        file_data = [{"name": "a.pdf", "size": "1KB"}, {"name": "b.pdf", "size": "2KB"}]
 
-        result = ui.select_files([file_data])
+        result = ui.select_files(file_data)
 
         assert result.kind == ActionKind.BACK
+
+    def test_select_files_selects_a_lone_file_without_a_menu(self):
+        """A single candidate is returned as selected without reading keys or drawing"""
+        console = _record_console()
+        ui = RetroCLI(console=console, keyboard_reader=Mock(side_effect=AssertionError))
+
+        result = ui.select_files([{"name": "a.pdf", "size": "1KB"}])
+
+        assert result == ActionResult.value([0])
+        assert console.export_text() == ""
+
+    def test_select_files_returns_no_selection_for_no_files(self):
+        """An empty list returns immediately instead of waiting for keys on a blank screen"""
+        console = _record_console()
+        ui = RetroCLI(console=console, keyboard_reader=Mock(side_effect=AssertionError))
+
+        assert ui.select_files([]) == ActionResult.value([])
+        assert console.export_text() == ""
     
     def test_clear_and_show_header(self):
         """Test clear_and_show_header clears console and redraws header"""
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         
         # Add some initial content
@@ -477,9 +690,34 @@ class TestSelectionMethods:
         text = console.export_text()
         assert "epub | pdf -> txt" in text.lower()
 
-    def test_ask_again_enter_and_quit(self):
+    def test_clear_and_show_header_repaints_inside_synchronized_update(self):
+        """Repaint from home and erase leftovers, bracketed by DEC 2026 begin/end markers"""
+        console = _record_console()
+        ui = RetroCLI(console=console)
+
+        ui.clear_and_show_header()
+
+        output = console.file.getvalue()
+        assert output.startswith(SYNC_BEGIN + "\033[H")
+        assert output.endswith(ERASE_BELOW + SYNC_END)
+        assert "\033[2J" not in output
+        assert all(line.endswith("\033[0K") for line in output.splitlines()[:-1])
+        assert output.count(SYNC_BEGIN) == output.count(SYNC_END) == 1
+
+    def test_clear_and_show_header_skips_sync_markers_off_terminal(self):
+        """Non-terminal output gets neither clears nor synchronization markers"""
+        console = Console(record=True, force_terminal=False, width=120, file=io.StringIO())
+        ui = RetroCLI(console=console)
+
+        ui.clear_and_show_header()
+
+        output = console.file.getvalue()
+        assert SYNC_BEGIN not in output
+        assert "epub | pdf -> txt" in output
+
+    def test_ask_again_enter_and_quit(self, keyboard_from_string):
         """ask_again should return True for Enter and False for 'q'"""
-        console = Console(record=True)
+        console = _record_console()
         
         # Test Enter -> Proceed
         keyboard_reader = keyboard_from_string("ENTER")
@@ -493,9 +731,9 @@ class TestSelectionMethods:
         res = ui.ask_again()
         assert res.kind == ActionKind.TERMINATE
 
-    def test_ask_again_ignores_other_keys(self):
+    def test_ask_again_ignores_other_keys(self, keyboard_from_string):
         """ask_again should ignore unrelated keys until a valid one is pressed"""
-        console = Console(record=True)
+        console = _record_console()
         
         # Sequence: x (ignored), ENTER (accepted)
         keyboard_reader = keyboard_from_string("x ENTER")
@@ -504,185 +742,180 @@ class TestSelectionMethods:
         assert res.kind == ActionKind.PROCEED
 
 
+@pytest.fixture(scope="class")
+def _shared_files(tmp_path_factory):
+    """Three empty PDF files shared by every test in a class."""
+    directory = tmp_path_factory.mktemp("selection")
+    files = [directory / f"file{i}.pdf" for i in range(3)]
+    for f in files:
+        os.close(os.open(f, os.O_CREAT | os.O_WRONLY, 0o644))
+    return files
+
+
+@pytest.fixture(scope="class")
+def file_data_3(_shared_files):
+    """View file data for the three shared files, built once per class."""
+    return [file_from_path(p).to_dict() for p in _shared_files]
+
+
 class TestInteractiveSelection:
     """Test interactive file selection"""
-    
-    @staticmethod
-    def _paths_to_file_data(paths):
-        """Convert Path objects to file data dicts for view."""
-        return [file_from_path(p).to_dict() for p in paths]
-    
-    def test_select_files_enter_immediately(self, tmp_path):
-        """Test selecting files by pressing enter immediately (no selection)"""
-        files = [tmp_path / f"file{i}.pdf" for i in range(3)]
-        for f in files:
-            f.touch()
-        
-        # Simulate pressing Enter immediately
-        keyboard_reader = keyboard_from_string("ENTER")
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_reader)
-        
-        file_data = self._paths_to_file_data(files)
-        selected = ui.select_files(file_data)
 
-        assert selected.payload == []
-    
-    def test_select_files_space_then_enter(self, tmp_path):
-        """Test selecting file with space then enter"""
-        files = [tmp_path / f"file{i}.pdf" for i in range(2)]
-        for f in files:
-            f.touch()
-        
-        # Simulate: space (select), enter (confirm)
-        keyboard_reader = keyboard_from_string("SPACE ENTER")
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_reader)
-        
-        file_data = self._paths_to_file_data(files)
-        selected = ui.select_files(file_data).payload
+    @pytest.mark.parametrize(
+        "keys, kind, expected",
+        [
+            ("ENTER", ActionKind.VALUE, []),
+            ("SPACE ENTER", ActionKind.VALUE, [0]),
+            ("DOWN SPACE ENTER", ActionKind.VALUE, [1]),
+            ("UP SPACE ENTER", ActionKind.VALUE, [2]),
+            ("SPACE SPACE ENTER", ActionKind.VALUE, []),
+            ("a ENTER", ActionKind.VALUE, [0, 1, 2]),
+            ("a a ENTER", ActionKind.VALUE, []),
+            ("a SPACE ENTER", ActionKind.VALUE, [1, 2]),
+            ("q", ActionKind.TERMINATE, None),
+        ],
+        ids=[
+            "enter_immediately",
+            "space_then_enter",
+            "down_arrow",
+            "up_arrow_wraps",
+            "toggle_on_off",
+            "select_all",
+            "all_toggle_deselect",
+            "all_continues_loop",
+            "quit",
+        ],
+    )
+    def test_select_files(self, ui_factory, file_data_3, keyboard_from_string, keys, kind, expected):
+        """Drive select_files with a key sequence and check the outcome"""
+        ui = ui_factory(keyboard_from_string(keys))
+
+        result = ui.select_files(file_data_3)
+
+        assert result.kind == kind
+        assert result.payload == expected
+
+    def test_select_files_redraws_only_on_state_change(self, ui_factory, file_data_3, keyboard_from_string):
+        """Keys that do not change the selection should not trigger a repaint"""
+        ui = ui_factory(keyboard_from_string("x x DOWN ENTER"))
+
+        with patch.object(Live, "update", autospec=True, side_effect=Live.update) as update:
+            ui.select_files(file_data_3)
+
+        # initial body and the DOWN move
+        assert update.call_count == 2
+        assert ui.console.export_text().count(RetroCLI.VERSION) == 1
+
+    def test_select_files_repaints_the_rows_each_key_changes(self, ui_factory, file_data_3, keyboard_from_string):
+        """A cursor move updates the two affected rows and a toggle updates one"""
+        ui = ui_factory(keyboard_from_string("DOWN SPACE ENTER"))
+
+        with patch.object(Live, "update", autospec=True, side_effect=Live.update) as update:
+            assert ui.select_files(file_data_3).payload == [1]
+
+        assert update.call_count == 3
+        assert _file_row_frames(ui.console)[:3] == [
+            ("►❏", " ❏", " ❏"),
+            (" ❏", "►❏", " ❏"),
+            (" ❏", "►✔", " ❏"),
+        ]
+
+    def test_select_files_restores_rows_when_the_cursor_returns(self, ui_factory, file_data_3, keyboard_from_string):
+        """Moving back onto a row paints it exactly as it looked the first time"""
+        ui = ui_factory(keyboard_from_string("DOWN UP DOWN UP ENTER"))
+
+        with patch.object(Live, "update", autospec=True, side_effect=Live.update) as update:
+            ui.select_files(file_data_3)
+
+        first, second = ("►❏", " ❏", " ❏"), (" ❏", "►❏", " ❏")
+        assert update.call_count == 5
+        assert _file_row_frames(ui.console)[:5] == [first, second, first, second, first]
+
+    def test_select_files_reuses_the_indented_body_between_frames(self, ui_factory, file_data_3, keyboard_from_string):
+        """Every repaint hands Live the same wrapper; only the rows inside it change"""
+        ui = ui_factory(keyboard_from_string("DOWN DOWN ENTER"))
+
+        with patch.object(Live, "update", autospec=True, side_effect=Live.update) as update:
+            ui.select_files(file_data_3)
+
+        bodies = [c.args[1] for c in update.call_args_list]
+        assert len(bodies) == 3
+        assert bodies[0] is bodies[1] is bodies[2]
+
+    def test_file_rows_leave_shared_prefixes_untouched(self, ui):
+        """Rows copy their cursor/checkbox prefix before adding the file details"""
+        first = ui._file_row(True, False, "a.pdf", "1 KB")
+        second = ui._file_row(True, False, "b.pdf", "2 KB")
+
+        assert first.plain == "► ❏ a.pdf (1 KB)"
+        assert second.plain == "► ❏ b.pdf (2 KB)"
+        assert ui._file_row_prefixes[True, False].plain == "► ❏ "
+        assert ui._file_row(False, True, "c.pdf", "3 KB").plain == "  ✔ c.pdf (3 KB)"
+
+    def test_select_files_shows_file_names_literally(self, ui_factory, keyboard_from_string):
+        """Brackets and colons in file names are not read as markup or emoji codes"""
+        ui = ui_factory(keyboard_from_string("ENTER"))
+
+        ui.select_files([{"name": "[bold]notes:smile:.pdf", "size": "1 KB"}, {"name": "b.pdf", "size": "2 KB"}])
+
+        assert "[bold]notes:smile:.pdf (1 KB)" in ui.console.export_text()
+
+    def test_select_files_drains_pending_keys_before_redraw(self, shared_ui, file_data_3, keyboard_from_string):
+        """Buffered keys are applied together and followed by a single repaint"""
+        ui = RetroCLI(
+            console=shared_ui.console,
+            keyboard_reader=keyboard_from_string("DOWN DOWN SPACE UP ENTER"),
+            keys_pending=Mock(side_effect=[False, True, True, True, False, False]),
+        )
 
-        assert selected == [0]
-    
-    def test_select_files_down_arrow(self, tmp_path):
-        """Test navigating with down arrow"""
-        files = [tmp_path / f"file{i}.pdf" for i in range(3)]
-        for f in files:
-            f.touch()
-        
-        # Simulate: down arrow, space, enter
-        keyboard_reader = keyboard_from_string("DOWN SPACE ENTER")
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_reader)
-        
-        file_data = self._paths_to_file_data(files)
-        selected = ui.select_files(file_data)
-        if isinstance(selected, ActionResult):
-            selected = selected.payload
-
-        # Should select second file (index 1)
-        assert len(selected) == 1
-        assert selected[0] == 1
-    
-    def test_select_files_up_arrow(self, tmp_path):
-        """Test navigating with up arrow (wraps to end)"""
-        files = [tmp_path / f"file{i}.pdf" for i in range(3)]
-        for f in files:
-            f.touch()
-        
-        # Simulate: up arrow (wraps to last), space, enter
-        keyboard_reader = keyboard_from_string("UP SPACE ENTER")
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_reader)
-        
-        file_data = self._paths_to_file_data(files)
-        selected = ui.select_files(file_data)
-        if isinstance(selected, ActionResult):
-            selected = selected.payload
-
-        # Should wrap to last file
-        assert len(selected) == 1
-        assert selected[0] == 2  # Last file index
-    
-    def test_select_files_toggle_on_off(self, tmp_path):
-        """Test toggling selection on and off"""
-        files = [tmp_path / "file.pdf"]
-        files[0].touch()
-        
-        # Simulate: space (select), space (deselect), enter
-        keyboard_reader = keyboard_from_string("SPACE SPACE ENTER")
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_reader)
-        
-        file_data = self._paths_to_file_data(files)
-        selected = ui.select_files(file_data)
-        if isinstance(selected, ActionResult):
-            selected = selected.payload
+        with patch.object(Live, "update", autospec=True, side_effect=Live.update) as update:
+            result = ui.select_files(file_data_3)
 
-        # Should be deselected
-        assert selected == []
-    
-    def test_select_files_select_all(self, tmp_path):
-        """Test selecting all with 'a' key - should select but not confirm"""
-        files = [tmp_path / f"file{i}.pdf" for i in range(3)]
-        for f in files:
-            f.touch()
-        
-        # Simulate: 'a' (select all), enter (confirm)
-        keyboard_reader = keyboard_from_string("a ENTER")
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_reader)
-        
-        file_data = self._paths_to_file_data(files)
-        selected = ui.select_files(file_data)
-        if isinstance(selected, ActionResult):
-            selected = selected.payload
+        assert result.payload == [2]
+        # the initial frame and one frame for the whole burst
+        assert update.call_count == 2
 
-        assert len(selected) == 3
-        assert selected == [0, 1, 2]  # All indices
-    
-    def test_select_files_quit(self, tmp_path):
-        """Test quitting with 'q' key exits application"""
-        files = [tmp_path / "file.pdf"]
-        files[0].touch()
-        # Simulate: 'q' (quit)
-        keyboard_reader = keyboard_from_string("q")
-        
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_reader)
-        
-        file_data = self._paths_to_file_data(files)
-        # The UI may now return an ActionResult.terminate() instead of raising SystemExit
-        try:
-            res = ui.select_files(file_data)
-            if isinstance(res, ActionResult):
-                # Expect a terminate action
-                assert res.kind.name == 'TERMINATE'
-        except SystemExit as exc:
-            assert exc.code == 0
-    def test_select_files_all_toggle_deselect(self, tmp_path):
-        """Test [A] pressed twice toggles: select all then deselect all"""
-        files = [tmp_path / f"file{i}.pdf" for i in range(3)]
-        for f in files:
-            f.touch()
-        
-        # Simulate: 'a' (select all), 'a' (deselect all), enter
-        keyboard_input = keyboard_from_string("a a ENTER")
-        
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_input)
-        
-        file_data = self._paths_to_file_data(files)
-        selected = ui.select_files(file_data)
-        if isinstance(selected, ActionResult):
-            selected = selected.payload
+    def test_select_files_throttles_repaints_to_frame_rate(self, shared_ui, file_data_3, keyboard_from_string):
+        """Keys arriving within one frame interval are folded into the next frame"""
+        waits = []
 
-        # Should be empty after toggle
-        assert len(selected) == 0
-    
-    def test_select_files_all_continues_loop(self, tmp_path):
-        """Test [A] selects all but allows further navigation before confirm"""
-        files = [tmp_path / f"file{i}.pdf" for i in range(3)]
-        for f in files:
-            f.touch()
-        
-        # Simulate: 'a' (select all), space (deselect current), enter
-        keyboard_input = keyboard_from_string("a SPACE ENTER")
-        
-        console = Console(record=True)
-        ui = RetroCLI(console=console, keyboard_reader=keyboard_input)
-        
-        file_data = self._paths_to_file_data(files)
-        
-        selected = ui.select_files(file_data)
-        if isinstance(selected, ActionResult):
-            selected = selected.payload
+        def keys_pending(timeout=0):
+            waits.append(timeout)
+            return timeout > 0
+
+        ui = RetroCLI(
+            console=shared_ui.console,
+            keyboard_reader=keyboard_from_string("DOWN DOWN ENTER"),
+            keys_pending=keys_pending,
+        )
+
+        with patch("view.ui.time.monotonic", return_value=0.0), \
+                patch.object(Live, "update", autospec=True, side_effect=Live.update) as update:
+            assert ui.select_files(file_data_3).payload == []
+
+        assert update.call_count == 1
+        # first frame paints at once; after each DOWN the next key lands inside the frame wait
+        assert waits == [0, 0, FRAME_INTERVAL, 0, FRAME_INTERVAL]
+
+    def test_select_files_reads_keys_inside_one_session(self, shared_ui, file_data_3, keyboard_from_string):
+        events = []
+        keys = keyboard_from_string("DOWN SPACE ENTER")
 
-        # Should have 2 files (all 3 selected, then current deselected)
-        assert len(selected) == 2
-        assert 0 not in selected  # Current (first) was deselected
-        assert 1 in selected
-        assert 2 in selected
+        @contextmanager
+        def session():
+            events.append("enter")
+            yield
+            events.append("exit")
+
+        def reader():
+            events.append("key")
+            return keys()
+
+        ui = RetroCLI(console=shared_ui.console, keyboard_reader=reader, keyboard_session=session)
+        ui.clear_and_show_header = Mock()
+
+        assert ui.select_files(file_data_3).payload == [1]
+        assert events == ["enter", "key", "key", "key", "exit"]
 
 
 class TestUserInput:
@@ -692,7 +925,7 @@ class TestUserInput:
         """Test getting valid user input"""
         inputs = iter(["test.pdf"])
         
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         # Temporarily override UI methods and restore afterward
         orig_input = ui.input_center
@@ -700,8 +933,8 @@ class TestUserInput:
         orig_select_merge = ui.select_merge_mode
         try:
             ui.input_center = lambda prompt=">>: ": next(inputs)
-            ui.select_output_format = lambda: ActionResult.value(OutputFormat.PLAIN_TEXT)
-            ui.select_merge_mode = lambda: MergeMode.NO_MERGE
+            ui.select_output_format = lambda _v=_PT: ActionResult.value(_v)
+            ui.select_merge_mode = lambda _v=_NM: _v
 
             path = ui.input_center()
             format_choice = ui.select_output_format()
@@ -721,7 +954,7 @@ class TestUserInput:
         """Ensure `get_path_input` clears, draws header, and returns input_center value"""
         from unittest.mock import Mock
 
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
 
         ui.draw_header = Mock()
@@ -731,12 +964,22 @@ class TestUserInput:
         if isinstance(result, ActionResult):
             result = result.payload
         assert result == "/some/path"
+
+    def test_get_path_input_prints_screen_once(self):
+        """Header, breadcrumb, prompt and hints reach the console in one print"""
+        ui = RetroCLI(console=_record_console())
+
+        with patch.object(ui.console, "print") as console_print, patch("view.ui.stdout"), \
+                patch("builtins.input", return_value="book.pdf"):
+            assert ui.get_path_input().payload == "book.pdf"
+
+        console_print.assert_called_once()
     
     def test_get_user_input_format_2(self):
         """Test format choice 2 (markdown)"""
         inputs = iter(["doc.epub"])
         
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         orig_input = ui.input_center
         orig_select_format = ui.select_output_format
@@ -744,8 +987,8 @@ class TestUserInput:
         orig_prompt = ui.prompt_merged_filename
         try:
             ui.input_center = lambda prompt=">>: ": next(inputs)
-            ui.select_output_format = lambda: ActionResult.value(OutputFormat.MARKDOWN)
-            ui.select_merge_mode = lambda: MergeMode.MERGE
+            ui.select_output_format = lambda _v=_MD: ActionResult.value(_v)
+            ui.select_merge_mode = lambda _v=_M: _v
             ui.prompt_merged_filename = lambda: "my_merged"
 
             path = ui.input_center()
@@ -766,15 +1009,15 @@ class TestUserInput:
         """Test format choice 3 (json)"""
         inputs = iter(["/data"])
         
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         orig_input = ui.input_center
         orig_select_format = ui.select_output_format
         orig_select_merge = ui.select_merge_mode
         try:
             ui.input_center = lambda prompt=">>: ": next(inputs)
-            ui.select_output_format = lambda: ActionResult.value(OutputFormat.JSON)
-            ui.select_merge_mode = lambda: MergeMode.PER_PAGE
+            ui.select_output_format = lambda _v=_JSON: ActionResult.value(_v)
+            ui.select_merge_mode = lambda _v=_PP: _v
 
             path = ui.input_center()
             format_choice = ui.select_output_format()
@@ -793,15 +1036,15 @@ class TestUserInput:
         """Test merge prompt returns no_merge by default"""
         inputs = iter(["test.pdf"])
         
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         orig_input = ui.input_center
         orig_select_format = ui.select_output_format
         orig_select_merge = ui.select_merge_mode
         try:
             ui.input_center = lambda prompt=">>: ": next(inputs)
-            ui.select_output_format = lambda: ActionResult.value(OutputFormat.MARKDOWN)
-            ui.select_merge_mode = lambda: MergeMode.NO_MERGE
+            ui.select_output_format = lambda _v=_MD: ActionResult.value(_v)
+            ui.select_merge_mode = lambda _v=_NM: _v
 
             path = ui.input_center()
             format_choice = ui.select_output_format()
@@ -819,15 +1062,15 @@ class TestUserInput:
         """Test merge mode selection returns no_merge"""
         inputs = iter(["test.pdf"])
         
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         orig_input = ui.input_center
         orig_select_format = ui.select_output_format
         orig_select_merge = ui.select_merge_mode
         try:
             ui.input_center = lambda prompt=">>: ": next(inputs)
-            ui.select_output_format = lambda: ActionResult.value(OutputFormat.MARKDOWN)
-            ui.select_merge_mode = lambda: MergeMode.NO_MERGE
+            ui.select_output_format = lambda _v=_MD: ActionResult.value(_v)
+            ui.select_merge_mode = lambda _v=_NM: _v
 
             path = ui.input_center()
             format_choice = ui.select_output_format()
@@ -845,15 +1088,15 @@ class TestUserInput:
         """Test merge mode selection returns per_page"""
         inputs = iter(["test.pdf"])
         
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         orig_input = ui.input_center
         orig_select_format = ui.select_output_format
         orig_select_merge = ui.select_merge_mode
         try:
             ui.input_center = lambda prompt=">>: ": next(inputs)
-            ui.select_output_format = lambda: ActionResult.value(OutputFormat.MARKDOWN)
-            ui.select_merge_mode = lambda: MergeMode.PER_PAGE
+            ui.select_output_format = lambda _v=_MD: ActionResult.value(_v)
+            ui.select_merge_mode = lambda _v=_PP: _v
 
             path = ui.input_center()
             format_choice = ui.select_output_format()
@@ -870,7 +1113,7 @@ class TestUserInput:
     def test_prompt_merged_filename(self):
         """Test prompting for merged filename"""
         from unittest.mock import Mock
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.input_center = Mock(return_value="  my_file  ")
         filename = ui.prompt_merged_filename()
@@ -880,14 +1123,19 @@ class TestUserInput:
         assert filename == "my_file"
 
 
+@pytest.fixture
+def manual_live():
+    """Run the progress Live without its background refresh thread."""
+    with patch("view.ui.Live", partial(Live, auto_refresh=False)), patch("rich.progress.Progress.refresh"):
+        yield
+
+
+@pytest.mark.usefixtures("manual_live")
 class TestProgressBar:
     """Test progress bar functionality"""
     
-    def test_get_progress_bar_context_manager(self):
+    def test_get_progress_bar_context_manager(self, ui):
         """Test progress bar as context manager"""
-        console = Console(record=True)
-        ui = RetroCLI(console=console)
-        
         with ui.get_progress_bar() as progress:
             assert progress is not None
             
@@ -898,11 +1146,8 @@ class TestProgressBar:
             # Update task
             progress.update(task_id, completed=50)
     
-    def test_get_progress_bar_multiple_tasks(self):
+    def test_get_progress_bar_multiple_tasks(self, ui):
         """Test progress bar with multiple tasks"""
-        console = Console(record=True)
-        ui = RetroCLI(console=console)
-        
         with ui.get_progress_bar() as progress:
             task1 = progress.add_task("file1", total=100, status="pending", filename="file1.pdf")
             task2 = progress.add_task("file2", total=100, status="pending", filename="file2.pdf")
@@ -910,14 +1155,46 @@ class TestProgressBar:
             progress.update(task1, completed=100, status="done")
             progress.update(task2, completed=50, status="converting")
 
+    def test_get_progress_bar_reuses_columns(self, ui):
+        """Column objects are built once per UI and shared by every progress bar"""
+        with ui.get_progress_bar() as first:
+            pass
+        with ui.get_progress_bar() as second:
+            pass
+
+        assert first.columns == second.columns == ui._progress_columns
+
+    def test_get_progress_bar_forgets_rendered_texts_when_done(self, ui):
+        """Per-filename Texts do not outlive the progress bar that rendered them"""
+        _, description, _, percentage, elapsed = ui._progress_columns
+        with ui.get_progress_bar() as progress:
+            progress.add_task("file1", total=100, status="converting", filename="file1.pdf")
+            description.render(progress.tasks[0])
+            percentage.render(progress.tasks[0])
+            elapsed.render(progress.tasks[0])
+            assert description._texts and percentage._texts and elapsed._clocks
+
+        assert not description._texts
+        assert not percentage._texts
+        assert not elapsed._clocks
+
+    def test_get_progress_bar_uses_configured_refresh_rate(self, shared_ui):
+        """The progress Live refreshes at the rate passed to the constructor"""
+        ui = RetroCLI(console=shared_ui.console, progress_refresh_per_second=4)
+
+        with patch("view.ui.Live", side_effect=Live) as live:
+            with ui.get_progress_bar():
+                pass
+
+        live.assert_called_once()
+        assert live.call_args.kwargs["refresh_per_second"] == 4
+
 
 class TestInputCenter:
     """Test centered input method"""
     
-    def test_input_center_default_prompt(self):
+    def test_input_center_default_prompt(self, ui):
         """Test input_center with default prompt"""
-        console = Console()
-        ui = RetroCLI(console=console)
         orig_input = __import__("builtins").input
         try:
             # Patch built-in input to avoid OSError
@@ -927,10 +1204,8 @@ class TestInputCenter:
         finally:
             __import__("builtins").input = orig_input
 
-    def test_input_center_custom_prompt(self):
+    def test_input_center_custom_prompt(self, ui):
         """Test input_center with custom prompt"""
-        console = Console()
-        ui = RetroCLI(console=console)
         orig_input = __import__("builtins").input
         try:
             __import__("builtins").input = lambda *args, **kwargs: "custom"
@@ -939,12 +1214,35 @@ class TestInputCenter:
         finally:
             __import__("builtins").input = orig_input
 
+    def test_input_center_reads_through_injected_line_reader(self, shared_ui):
+        """Text prompts read from the injected line reader instead of builtins.input"""
+        ui = RetroCLI(console=shared_ui.console, line_reader=lambda: "injected")
+
+        with patch("view.ui.stdout"):
+            assert ui.input_center() == "injected"
+
+    def test_input_center_shows_hint_literally(self, shared_ui):
+        """Hints with brackets are printed as typed rather than parsed as markup"""
+        ui = RetroCLI(console=shared_ui.console, line_reader=lambda: "")
+        shared_ui.console.export_text(clear=True)
+
+        with patch("view.ui.stdout"):
+            ui.input_center(hint="e.g. [red]notes[/red].pdf")
+
+        assert "e.g. [red]notes[/red].pdf" in shared_ui.console.export_text()
+
+    def test_input_center_moves_cursor_in_one_write(self, ui):
+        """Cursor repositioning is emitted as one write per direction"""
+        with patch("view.ui.stdout") as fake_stdout, patch("builtins.input", return_value="typed"):
+            assert ui.input_center() == "typed"
+
+        left = ui._left_pad + 3 + 2
+        assert [c.args[0] for c in fake_stdout.write.call_args_list] == [f"\033[5A\033[{left}C", "\033[5B"]
+        assert fake_stdout.flush.call_count == 2
 
-def test_retrocli_basic_rendering():
-    """Original basic rendering test"""
-    console = Console(record=True)
-    ui = RetroCLI(console=console)
 
+def test_retrocli_basic_rendering(ui):
+    """Original basic rendering test"""
     # Should not raise
     ui.draw_header()
     ui.print_center("hello world")
@@ -954,9 +1252,9 @@ def test_retrocli_basic_rendering():
 class TestMergeModeSelection:
     """Test merge mode selection UI"""
     
-    def test_select_merge_mode_navigation(self):
+    def test_select_merge_mode_navigation(self, keyboard_from_string):
         """Test _select_merge_mode with arrow key navigation"""
-        console = Console(record=True)
+        console = _record_console()
         
         # Simulate: down arrow, down arrow, enter (selects "per_page")
         keyboard_input = keyboard_from_string("DOWN DOWN ENTER")
@@ -968,9 +1266,9 @@ class TestMergeModeSelection:
             result = result.payload
         assert result == MergeMode.PER_PAGE
     
-    def test_select_merge_mode_up_arrow_wrapping(self):
+    def test_select_merge_mode_up_arrow_wrapping(self, keyboard_from_string):
         """Test _select_merge_mode with up arrow wrapping to end"""
-        console = Console(record=True)
+        console = _record_console()
         
         # Simulate: up arrow (wraps to last), enter
         keyboard_input = keyboard_from_string("UP ENTER")
@@ -982,12 +1280,57 @@ class TestMergeModeSelection:
             result = result.payload
         assert result == MergeMode.PER_PAGE
 
+    def test_select_merge_mode_repaints_only_when_cursor_moves(self, keyboard_from_string):
+        """Ignored keys and wrap-around back to the same row do not repaint"""
+        console = _record_console()
+        ui = RetroCLI(console=console, keyboard_reader=keyboard_from_string("x DOWN UP z DOWN ENTER"))
+
+        with patch.object(Live, "update", autospec=True, side_effect=Live.update) as update:
+            assert ui.select_merge_mode().payload == MergeMode.MERGE
+
+        # initial, DOWN, UP, DOWN; the ignored keys paint nothing
+        assert update.call_count == 4
+        marks = re.findall(r"([► ]) [●○] ", console.export_text())
+        cursors = [marks[i:i + 3].index("►") for i in range(0, len(marks), 3)]
+        assert cursors[:4] == [0, 1, 0, 1]
+
+    def test_select_merge_mode_follows_a_resize_while_open(self):
+        """A terminal resized between keys repaints the header and menu at the new width"""
+        console = _record_console()
+        keys = iter([DOWN_TOKEN, ENTER_TOKEN])
+
+        def reader():
+            console.width = 80
+            return next(keys)
+
+        ui = RetroCLI(console=console, max_width=100, keyboard_reader=reader)
+
+        assert ui.select_merge_mode().payload == MergeMode.MERGE
+        title_rules = re.findall(r"─ \[select merge mode\] ─+", console.export_text())
+        assert len(title_rules[0]) == 100 - 2
+        assert len(title_rules[-1]) == 80 - 2
+
+    def test_select_merge_mode_drains_pending_keys(self, keyboard_from_string):
+        """A burst of buffered arrows is folded into the final choice with a single repaint"""
+        ui = RetroCLI(
+            console=_record_console(),
+            keyboard_reader=keyboard_from_string("DOWN DOWN UP ENTER"),
+            keys_pending=Mock(side_effect=[False, True, True, False, False]),
+        )
+
+        with patch.object(Live, "update", autospec=True, side_effect=Live.update) as update:
+            assert ui.select_merge_mode().payload == MergeMode.MERGE
+
+        # the initial frame and one frame for the whole burst
+        assert update.call_count == 2
+
+
 class TestOutputFormatSelection:
     """Test output format selection UI"""
     
-    def test_select_output_format_navigation(self):
+    def test_select_output_format_navigation(self, keyboard_from_string):
         """Test _select_output_format with arrow key navigation"""
-        console = Console(record=True)
+        console = _record_console()
         
         # Simulate: down arrow, down arrow, enter (selects json = 3)
         keyboard_input = keyboard_from_string("DOWN DOWN ENTER")
@@ -997,9 +1340,9 @@ class TestOutputFormatSelection:
         result = ui.select_output_format()
         assert result.payload == OutputFormat.JSON
     
-    def test_select_output_format_up_arrow_wrapping(self):
+    def test_select_output_format_up_arrow_wrapping(self, keyboard_from_string):
         """Test _select_output_format with up arrow wrapping to end"""
-        console = Console(record=True)
+        console = _record_console()
         
         # Simulate: up arrow (wraps to json), enter
         keyboard_input = keyboard_from_string("UP ENTER")
@@ -1009,9 +1352,9 @@ class TestOutputFormatSelection:
         result = ui.select_output_format()
         assert result.payload == OutputFormat.JSON
     
-    def test_select_output_format_default_selection(self):
+    def test_select_output_format_default_selection(self, keyboard_from_string):
         """Test _select_output_format with immediate enter (selects plain text = 1)"""
-        console = Console(record=True)
+        console = _record_console()
         
         # Simulate: enter (selects default plain text)
         keyboard_input = keyboard_from_string("ENTER")
@@ -1021,13 +1364,25 @@ class TestOutputFormatSelection:
         result = ui.select_output_format()
         assert result.payload == OutputFormat.PLAIN_TEXT
 
+    def test_select_output_format_builds_rows_once(self, keyboard_from_string):
+        """Radio rows are assembled once per option set and reused on later visits"""
+        keys = keyboard_from_string("DOWN ENTER ENTER")
+        ui = RetroCLI(console=_record_console(), keyboard_reader=keys)
+        ui.select_output_format()
+        radio_rows = ui._radio_rows(list(OutputFormat))
+
+        ui.select_output_format()
+
+        assert ui._radio_rows(list(OutputFormat)) is radio_rows
+        assert radio_rows[0][1].plain == "  ○ plain text (.txt)"
+
 
 class TestQuitHandlers:
     """Tests for handlers that accept '\\q' to quit/terminate."""
 
     def test_get_path_input_colon_q_terminates(self):
         from unittest.mock import Mock
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.input_center = Mock(return_value="\\q")
         result = ui.get_path_input()
@@ -1037,7 +1392,7 @@ class TestQuitHandlers:
 
     def test_prompt_merged_filename_colon_q_terminates(self):
         from unittest.mock import Mock
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.input_center = Mock(return_value="\\q")
         result = ui.prompt_merged_filename()
@@ -1050,7 +1405,7 @@ class TestBreadcrumb:
     """Tests for breadcrumb navigation functionality."""
     
     def test_draw_breadcrumb_with_source_only(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["test.pdf"]
         ui.draw_breadcrumb()
@@ -1058,7 +1413,7 @@ class TestBreadcrumb:
         assert "test.pdf" in output
     
     def test_draw_breadcrumb_with_source_and_format(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["test.pdf", "Plain Text"]
         ui.draw_breadcrumb()
@@ -1067,7 +1422,7 @@ class TestBreadcrumb:
         assert "Plain Text" in output
     
     def test_draw_breadcrumb_full_trail_no_merge(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["test.pdf", "Markdown", "No Merge"]
         ui.draw_breadcrumb()
@@ -1078,7 +1433,7 @@ class TestBreadcrumb:
         assert output.count(">>") == 2
     
     def test_draw_breadcrumb_with_merge_filename(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["/data", "JSON", "Merge All", "merged_output"]
         ui.draw_breadcrumb()
@@ -1090,7 +1445,7 @@ class TestBreadcrumb:
         assert output.count(">>") == 3
     
     def test_draw_breadcrumb_current_step_source(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["doc.epub"]
         ui.draw_breadcrumb()
@@ -1098,7 +1453,7 @@ class TestBreadcrumb:
         assert "doc.epub" in output
     
     def test_draw_breadcrumb_current_step_format(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["doc.epub", "Plain Text"]
         ui.draw_breadcrumb()
@@ -1107,7 +1462,7 @@ class TestBreadcrumb:
         assert "Plain Text" in output
     
     def test_draw_breadcrumb_partial_data(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["test.pdf", "JSON"]
         ui.draw_breadcrumb()
@@ -1115,8 +1470,22 @@ class TestBreadcrumb:
         assert "test.pdf" in output
         assert "JSON" in output
     
+    def test_draw_breadcrumb_reuses_panel_until_trail_changes(self):
+        ui = RetroCLI(console=_record_console())
+        ui.breadcrumb = ["a.pdf"]
+        ui.draw_breadcrumb()
+        panel = ui._breadcrumb_panel
+
+        ui.draw_breadcrumb()
+        assert ui._breadcrumb_panel is panel
+
+        ui.breadcrumb.append("[draft] JSON")
+        ui.draw_breadcrumb()
+        assert ui._breadcrumb_panel is not panel
+        assert ui._breadcrumb_panel.renderable.plain == "a.pdf >> [draft] JSON"
+
     def test_draw_breadcrumb_renders_without_border(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["file.pdf"]
         ui.draw_breadcrumb()
@@ -1124,7 +1493,7 @@ class TestBreadcrumb:
         assert "file.pdf" in output
     
     def test_draw_breadcrumb_pending_source_subtle_color(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["source", "Markdown"]
         ui.draw_breadcrumb()
@@ -1133,7 +1502,7 @@ class TestBreadcrumb:
         assert "Markdown" in output
     
     def test_draw_breadcrumb_pending_filename_subtle_color(self):
-        console = Console(record=True)
+        console = _record_console()
         ui = RetroCLI(console=console)
         ui.breadcrumb = ["test.pdf", "JSON", "Merge All", "output name"]
         ui.draw_breadcrumb()
@@ -1144,10 +1513,10 @@ class TestBreadcrumb:
         assert "output name" in output
 
     def test_draw_breadcrumb_always_called(self):
-        ui = RetroCLI(console=Console(record=True))
-        
-        with patch.object(ui, "draw_breadcrumb") as mock_draw_breadcrumb:
-            ui.clear_and_show_header()
-            mock_draw_breadcrumb.assert_called_once()
+        ui = RetroCLI(console=_record_console())
+        ui.draw_breadcrumb = Mock()
+
+        ui.clear_and_show_header()
+        ui.draw_breadcrumb.assert_called_once()
 
 
@@ -15,7 +15,7 @@ class ActionKind(Enum):
     TERMINATE = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionResult(Generic[T]):
     kind: ActionKind
     payload: Optional[T] = None
@@ -67,7 +67,7 @@ class UIInterface(ABC):
         pass
 
     @abstractmethod
-    def select_files(self, file_data: List[Dict[str, Any]]) -> List[int]:
+    def select_files(self, file_data: List[Dict[str, Any]]) -> ActionResult[List[int]]:
         """Display file selector and return indices of selected files.
         
         Args:
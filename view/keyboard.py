@@ -1,8 +1,13 @@
+import codecs
+import os
+import select
 import sys
 import tty
 import termios
 from enum import Enum, auto
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 class KeyboardKey(Enum):
@@ -22,30 +27,109 @@ class KeyboardToken:
 
 
 
+UP_TOKEN = KeyboardToken(KeyboardKey.UP)
+DOWN_TOKEN = KeyboardToken(KeyboardKey.DOWN)
+ENTER_TOKEN = KeyboardToken(KeyboardKey.ENTER)
+SPACE_TOKEN = KeyboardToken(KeyboardKey.SPACE)
+BACKSPACE_TOKEN = KeyboardToken(KeyboardKey.BACKSPACE)
+UNKNOWN_TOKEN = KeyboardToken(KeyboardKey.UNKNOWN)
+
+_CHAR = object()
+
+_SINGLE = {
+    "\r": ENTER_TOKEN,
+    "\n": ENTER_TOKEN,
+    " ": SPACE_TOKEN,
+    "\x7f": BACKSPACE_TOKEN,
+    "\b": BACKSPACE_TOKEN,
+    "\x1b": None,
+}
+
+_ESC = {
+    "[A": UP_TOKEN,
+    "[B": DOWN_TOKEN,
+    "OA": UP_TOKEN,
+    "OB": DOWN_TOKEN,
+}
+
+
+@lru_cache(maxsize=128)
+def char_token(ch: str) -> KeyboardToken:
+    return KeyboardToken(KeyboardKey.CHAR, ch.lower())
+
+
+_session_fd: Optional[int] = None
+
+
+@contextmanager
+def keyboard_session():
+    """Hold stdin in cbreak mode across an interactive loop."""
+    global _session_fd
+    if _session_fd is not None:
+        yield
+        return
+    fd = sys.stdin.fileno()
+    attr = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd, termios.TCSANOW)
+        mode = termios.tcgetattr(fd)
+        mode[tty.IFLAG] &= ~termios.IXON
+        mode[tty.LFLAG] &= ~termios.ISIG
+        termios.tcsetattr(fd, termios.TCSANOW, mode)
+        _session_fd = fd
+        yield
+    finally:
+        _session_fd = None
+        termios.tcsetattr(fd, termios.TCSANOW, attr)
+
+
+def _getch() -> str:
+    if _session_fd is None:
+        return sys.stdin.read(1)
+    decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")(errors="replace")
+    while True:
+        data = os.read(_session_fd, 1)
+        if not data:
+            return ""
+        ch = decoder.decode(data)
+        if ch:
+            return ch
+
+
+def _read_token() -> KeyboardToken:
+    ch = _getch()
+    token = _SINGLE.get(ch, _CHAR)
+    if token is _CHAR:
+        return char_token(ch)
+    if token is None:
+        return _read_escape()
+    return token
+
+
+def _read_escape() -> KeyboardToken:
+    sequence = _getch()
+    if sequence in ("[", "O"):
+        ch = _getch()
+        sequence += ch
+        while ch and not "@" <= ch <= "~":
+            ch = _getch()
+            sequence += ch
+    return _ESC.get(sequence, UNKNOWN_TOKEN)
+
+
 def read_char():
     """Reads a single character from stdin without waiting for Enter."""
+    if _session_fd is not None:
+        return _read_token()
     fd = sys.stdin.fileno()
     attr = termios.tcgetattr(fd)
     try:
         tty.setraw(fd)
-        ch = sys.stdin.read(1)
-        if ch == "\x1b":
-            next1 = sys.stdin.read(1)
-            next2 = sys.stdin.read(1)
-            if next1 == "[":
-                if next2 == "A":
-                    return KeyboardToken(KeyboardKey.UP)
-                if next2 == "B":
-                    return KeyboardToken(KeyboardKey.DOWN)
-            return KeyboardToken(KeyboardKey.UNKNOWN)
-
-        if ch in ("\r", "\n"):
-            return KeyboardToken(KeyboardKey.ENTER)
-        if ch == " ":
-            return KeyboardToken(KeyboardKey.SPACE)
-        if ch in ("\x7f", "\b"):
-            return KeyboardToken(KeyboardKey.BACKSPACE)
-        return KeyboardToken(KeyboardKey.CHAR, ch.lower())
-    
+        return _read_token()
     finally:
         termios.tcsetattr(fd, termios.TCSANOW, attr)
+
+
+def keys_pending(timeout: float = 0) -> bool:
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    return bool(ready)
@@ -8,16 +8,21 @@ class MergeMode(Enum):
 
     @property
     def display_name(self) -> str:
-        return {
-            MergeMode.NO_MERGE: "no merge",
-            MergeMode.MERGE: "merge",
-            MergeMode.PER_PAGE: "file per page"
-        }[self]
+        return _DISPLAY_NAMES[self]
 
     @property
     def display_hint(self) -> str:
-        return {
-            MergeMode.NO_MERGE: "(separate file per document)",
-            MergeMode.MERGE: "(combine all into single file)",
-            MergeMode.PER_PAGE: "(one file per page/chapter)"
-        }[self]
\ No newline at end of file
+        return _DISPLAY_HINTS[self]
+
+
+_DISPLAY_NAMES = {
+    MergeMode.NO_MERGE: "no merge",
+    MergeMode.MERGE: "merge",
+    MergeMode.PER_PAGE: "file per page"
+}
+
+_DISPLAY_HINTS = {
+    MergeMode.NO_MERGE: "(separate file per document)",
+    MergeMode.MERGE: "(combine all into single file)",
+    MergeMode.PER_PAGE: "(one file per page/chapter)"
+}
@@ -8,16 +8,23 @@ class OutputFormat(Enum):
 
     @property
     def extension(self) -> str:
-        return f".{self.value}"
+        return _EXTENSIONS[self]
 
     @property
     def display_name(self) -> str:
-        return {
-            OutputFormat.PLAIN_TEXT: "plain text",
-            OutputFormat.MARKDOWN: "markdown",
-            OutputFormat.JSON: "json"
-        }[self]
+        return _DISPLAY_NAMES[self]
 
     @property
     def display_hint(self) -> str:
-        return f"({self.extension})"
\ No newline at end of file
+        return _DISPLAY_HINTS[self]
+
+
+_EXTENSIONS = {fmt: f".{fmt.value}" for fmt in OutputFormat}
+
+_DISPLAY_NAMES = {
+    OutputFormat.PLAIN_TEXT: "plain text",
+    OutputFormat.MARKDOWN: "markdown",
+    OutputFormat.JSON: "json"
+}
+
+_DISPLAY_HINTS = {fmt: f"({extension})" for fmt, extension in _EXTENSIONS.items()}
@@ -1,20 +1,26 @@
 import time
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.progress import (
     Progress,
     TextColumn,
     BarColumn,
-    TimeRemainingColumn,
+    ProgressColumn,
     SpinnerColumn
 )
 from rich.live import Live
-from contextlib import contextmanager
-from rich.table import Table
-from rich.align import Align
+from contextlib import contextmanager, nullcontext
+from rich.padding import Padding
+from rich.segment import Segment
+from rich.measure import Measurement
+from rich.control import Control
+from rich.segment import ControlType
 from typing import Optional
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from collections import OrderedDict
 from view.output_format import OutputFormat
 from view.merge_mode import MergeMode
 from view.interface import UIInterface, ActionResult
@@ -34,108 +40,221 @@ HORIZONTALS_NO_BOTTOM = Box(
     "    \n"
 )
 
+CHECKBOX_ON = "✔"
+CHECKBOX_OFF = "❏"
+CURSOR_MARKER = "►"
+
+FRAME_INTERVAL = 1 / 30
+PROGRESS_REFRESH_PER_SECOND = 10
+
+SYNC_BEGIN = "\033[?2026h"
+SYNC_END = "\033[?2026l"
+ERASE_BELOW = "\033[J"
+
+ASCII_LOGO = """
+    ██╗   ██╗███████╗██╗     ██╗     ██╗   ██╗███╗   ███╗
+    ██║   ██║██╔════╝██║     ██║     ██║   ██║████╗ ████║
+    ██║   ██║█████╗  ██║     ██║     ██║   ██║██╔████╔██║
+    ╚██╗ ██╔╝██╔══╝  ██║     ██║     ██║   ██║██║╚██╔╝██║
+     ╚████╔╝ ███████╗███████╗███████╗╚██████╔╝██║ ╚═╝ ██║
+      ╚═══╝  ╚══════╝╚══════╝╚══════╝ ╚═════╝ ╚═╝     ╚═╝
+        """
+SUBTITLE = "[ epub | pdf -> txt ]"
+_LOGO_WIDTH = max(len(line) for line in ASCII_LOGO.splitlines())
+_SUBTITLE_LINE = "\n" + " " * ((_LOGO_WIDTH - (len(SUBTITLE) - 1)) // 2) + SUBTITLE.lower()
+
 # Breadcrumb is now a simple list of strings representing the path from the
 # workflow state stack. Legacy `BreadcrumbState` dataclass was removed.
 
+_EMPTY_FIELDS = MappingProxyType({})
+_STATIC_CACHE_SIZE = 4
+_STATIC_RENDERABLES = (
+    "_panel_kwargs",
+    "_header_panel",
+    "_centered_header",
+    "_file_select_hint_panel",
+    "_radio_hint_panel",
+    "_centered_input_hints",
+    "_centered_ask_again_hints",
+)
+
+
+def _read_line() -> str:
+    return input("")
+
+
+class _Prerendered:
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self._width = None
+        self._segments: list[Segment] = []
+
+    def __rich_console__(self, console, options):
+        if options.max_width != self._width:
+            self._segments = list(console.render(self.renderable, options))
+            self._width = options.max_width
+        return self._segments
+
+    def __rich_measure__(self, console, options):
+        return Measurement.get(console, options, self.renderable)
+
+
+class _Overwrite:
+    def __init__(self, renderable):
+        self.renderable = renderable
+
+    def __rich_console__(self, console, options):
+        erase_line = Control((ControlType.ERASE_IN_LINE, 0)).segment
+        newline = Segment.line()
+        for line in console.render_lines(self.renderable, options, pad=False):
+            yield from line
+            yield erase_line
+            yield newline
+
+
+_PAD2 = tuple(f"{i:02d}" for i in range(60))
+
+
+def _format_clock(secs: int) -> str:
+    if secs < 3600:
+        minutes, seconds = divmod(secs, 60)
+        return _PAD2[minutes] + ":" + _PAD2[seconds]
+    hours, remainder = divmod(secs, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:" + _PAD2[minutes] + ":" + _PAD2[seconds]
+
+
 class _StyledTimeMixin:
     def __init__(self, style: str, attr: str, time_provider=time.perf_counter):
         super().__init__()
         self._style = style
         self._attr = attr
         self._time_provider = time_provider
+        self._clocks: dict[int, tuple[int, Text]] = {}
 
     def render(self, task):
         value = getattr(task, self._attr)
         if value is None:
-            return Text("00:00", style=self._style)
-        return Text(self._format_time(value), style=self._style)
+            return self._clock_text(task.id, 0)
+        return self._clock_text(task.id, value)
 
     @staticmethod
     def _format_time(seconds: float) -> str:
+        return _format_clock(int(seconds))
+
+    def _clock_text(self, task_id: int, seconds: float) -> Text:
         secs = int(seconds)
-        hours, remainder = divmod(secs, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        if hours:
-            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes:02d}:{seconds:02d}"
+        clock = self._clocks.get(task_id)
+        if clock is None or clock[0] != secs:
+            clock = self._clocks[task_id] = (secs, Text(_format_clock(secs), style=self._style))
+        return clock[1]
+
+    def reset(self) -> None:
+        self._clocks.clear()
 
-class StyledTimeElapsedColumn(_StyledTimeMixin, TimeRemainingColumn):
+class StyledTimeElapsedColumn(_StyledTimeMixin, ProgressColumn):
     def __init__(self, style: str, time_provider=None):
         _StyledTimeMixin.__init__(self, style, "elapsed", time_provider=time_provider or time.perf_counter)
     
     def render(self, task):
-        fields = getattr(task, "fields", {}) or {}
+        fields = task.fields or _EMPTY_FIELDS
         status = fields.get("status", "pending")
         
         # When done, show final conversion time
         if status == "done":
             conversion_time = fields.get("conversion_time")
             if conversion_time is None:
-                return Text("00:00", style=self._style)
-            return Text(f"{self._format_time(conversion_time)}", style=self._style)
+                return self._clock_text(task.id, 0)
+            return self._clock_text(task.id, conversion_time)
         
         # While converting, calculate elapsed from start_time
         if status == "converting":
             start_time = fields.get("start_time")
             if start_time is not None:
-                elapsed = self._time_provider() - start_time
-                return Text(f"{self._format_time(elapsed)}", style=self._style)
+                return self._clock_text(task.id, self._time_provider() - start_time)
         
         # Pending or no start time
-        return Text("00:00", style=self._style)
+        return self._clock_text(task.id, 0)
 
 class StyledPercentageColumn(TextColumn):
     def __init__(self, colors: dict):
         super().__init__("{task.percentage:>3.0f}%")
         self.colors = colors
+        self._done_style = colors["confirm"]
+        self._active_style = colors["accented"]
+        self._texts: dict[tuple[int, bool], Text] = {}
 
     def render(self, task):
-        fields = getattr(task, "fields", {}) or {}
-        status = fields.get("status", "pending")
-        percentage = f"{task.percentage:>3.0f}%"
+        fields = task.fields or _EMPTY_FIELDS
+        key = (round(task.percentage), fields.get("status", "pending") == "done")
+        text = self._texts.get(key)
+        if text is None:
+            percent, done = key
+            text = self._texts[key] = Text(f"{percent:>3d}%", style=self._done_style if done else self._active_style)
+        return text
 
-        if status == "done":
-            return Text.from_markup(f"[{self.colors['confirm']}]{percentage}[/]")
-        else:
-            return Text.from_markup(f"[{self.colors['accented']}]{percentage}[/]")
+    def reset(self) -> None:
+        self._texts.clear()
 
 class StyledDescriptionColumn(TextColumn):
     def __init__(self, colors: dict):
         super().__init__("[progress.description]{task.description}")
         self.colors = colors
+        self._by_status = {
+            "converting": ("converting ", f"italic {colors['accented']}"),
+            "done": ("✓ ", colors["confirm"]),
+        }
+        self._pending = ("", colors["subtle"])
+        self._texts: dict[tuple[str, str], Text] = {}
 
     def render(self, task):
-        fields = getattr(task, "fields", {}) or {}
-        status = fields.get("status", "pending")
-        filename = fields.get("filename", "")
+        fields = task.fields or _EMPTY_FIELDS
+        key = (fields.get("status", "pending"), fields.get("filename", ""))
+        text = self._texts.get(key)
+        if text is None:
+            prefix, style = self._by_status.get(key[0], self._pending)
+            text = self._texts[key] = Text(prefix + key[1], style=style)
+        return text
 
-        if status == "converting":
-            return Text.from_markup(f"[italic {self.colors['accented']}]converting {filename}[/]")
-        elif status == "done":
-            return Text.from_markup(f"[{self.colors['confirm']}]✓ {filename}[/]")
-        else:
-            return Text.from_markup(f"[{self.colors['subtle']}]{filename}[/]")
+    def reset(self) -> None:
+        self._texts.clear()
 
 class RetroCLI(UIInterface):
     VERSION = "1.0.0"
+    _DEFAULT_COLORS = MappingProxyType({
+        "logo": "#c25a1a",       # Orange/rust for the ASCII logo
+        "primary": "#e9d8ff",    # Soft purple for primary text and prompts
+        "secondary": "#52d9d8",  # Teal for interactive options and highlights
+        "subtle": "#9aa0a6",     # Soft grey for borders and subtle UI elements
+        "accented": "#c9a961",   # Gold for progress indicators and emphasis
+        "confirm": "#6fc67c",    # Light green for confirmations and success
+        "error": "#ff6b81",      # Rosy red for error messages
+    })
     
-    def __init__(self, console: Optional[Console] = None, max_width: int = 120, colors: Optional[dict] = None, keyboard_reader=None):
+    def __init__(self, console: Optional[Console] = None, max_width: int = 120, colors: Optional[dict] = None, keyboard_reader=None, keys_pending=None, keyboard_session=None, line_reader=None, progress_refresh_per_second: float = PROGRESS_REFRESH_PER_SECOND):
         self._keyboard_reader = keyboard_reader
+        self.progress_refresh_per_second = progress_refresh_per_second
+        self._line_reader = line_reader or _read_line
+        self._keys_pending = keys_pending or (lambda timeout=0: False)
+        self._next_frame_at = 0.0
+        self._keyboard_session = keyboard_session or nullcontext
+        self._frame_buffer: Optional[list] = None
+        self._frame_clears = False
         self.max_width = max_width
         self.console = console or Console()
-        default_colors = {
-            "logo": "#c25a1a",       # Orange/rust for the ASCII logo
-            "primary": "#e9d8ff",    # Soft purple for primary text and prompts
-            "secondary": "#52d9d8",  # Teal for interactive options and highlights
-            "subtle": "#9aa0a6",     # Soft grey for borders and subtle UI elements
-            "accented": "#c9a961",   # Gold for progress indicators and emphasis
-            "confirm": "#6fc67c",    # Light green for confirmations and success
-            "error": "#ff6b81",      # Rosy red for error messages
-        }
-        self.colors = {**default_colors, **(colors or {})}
+        self.colors = {**self._DEFAULT_COLORS, **(colors or {})}
+        self._build_row_templates()
+        self._build_hint_texts()
+        self._panel_titles: dict[tuple[str, str], Text] = {}
+        self._logo = Text(ASCII_LOGO, style=self.colors["logo"]) + Text(_SUBTITLE_LINE, style=self.colors["accented"])
         
         # Breadcrumb state (updated by controller on state transitions)
         self.breadcrumb = []
+        self._breadcrumb_key = None
+
+        self._layout = None
+        self._static_by_layout = OrderedDict()
+        self._refresh_size()
 
     @property
     def keyboard_reader(self):
@@ -144,52 +263,142 @@ class RetroCLI(UIInterface):
     @property
     def panel_width(self) -> int:
         """Compute constrained panel width based on terminal and max width."""
-        return min(self.max_width, self.console.size.width)
+        return self._panel_width
 
-    def _create_panel(self, content, title: Optional[str] = None, padding: Optional[tuple] = None, title_color: Optional[str] = "primary", **style_args) -> Panel:
-        """Create a styled panel with consistent settings."""
-        kwargs = {
+    def _refresh_size(self) -> bool:
+        term_width = self.console.size.width
+        panel_width = min(self.max_width, term_width)
+        layout = (panel_width, (term_width - panel_width) // 2)
+        if layout == self._layout:
+            return False
+        self._layout = layout
+        self._panel_width, self._left_pad = layout
+        cached = self._static_by_layout.pop(layout, None)
+        if cached is None:
+            self._build_static_renderables()
+            cached = tuple(getattr(self, name) for name in _STATIC_RENDERABLES)
+        else:
+            for name, value in zip(_STATIC_RENDERABLES, cached):
+                setattr(self, name, value)
+        self._static_by_layout[layout] = cached
+        if len(self._static_by_layout) > _STATIC_CACHE_SIZE:
+            self._static_by_layout.popitem(last=False)
+        return True
+
+    def _build_row_templates(self) -> None:
+        self._row_primary = self.colors["primary"]
+        self._row_secondary = self.colors["secondary"]
+        self._row_subtle = self.colors["subtle"]
+        self._radio_row_cache: dict[tuple, list[tuple[Text, Text]]] = {}
+        self._file_row_prefixes: dict[tuple[bool, bool], Text] = {}
+        for checked, checkbox in ((True, CHECKBOX_ON), (False, CHECKBOX_OFF)):
+            self._file_row_prefixes[True, checked] = Text.assemble(
+                (CURSOR_MARKER, self._row_secondary), " ", (checkbox, self._row_secondary), " "
+            )
+            self._file_row_prefixes[False, checked] = Text(f"  {checkbox} ")
+
+    def _build_static_renderables(self) -> None:
+        self._panel_kwargs = {
             "border_style": self.colors["subtle"],
             "width": self.panel_width,
             "box": HORIZONTALS_NO_BOTTOM,
         }
+        self._header_panel = Panel(
+            Padding(self._logo, (0, 0, 0, max(0, (self.panel_width - 4 - _LOGO_WIDTH) // 2))),
+            border_style=f"dim {self.colors['subtle']}",
+            width=self.panel_width,
+            box=HEAVY_HEAD,
+            subtitle=f"[not dim {self.colors['subtle']}]{self.VERSION}[/]",
+            subtitle_align="right",
+        )
+        self._centered_header = _Prerendered(self._indent(self._header_panel))
+        self._file_select_hint_panel = self._prerendered_hint(self._file_select_hints)
+        self._radio_hint_panel = self._prerendered_hint(self._radio_hints)
+        self._centered_input_hints = _Prerendered(self._indent(self._create_hint_panel(self._input_hints)))
+        self._centered_ask_again_hints = _Prerendered(self._indent(self._create_hint_panel(self._ask_again_hints)))
+
+    def _build_hint_texts(self) -> None:
+        key, primary = self.colors["secondary"], self.colors["primary"]
+        self._file_select_hints = Text.from_markup(
+            f"[{primary}][{key}]⬆︎ /⬇︎[/] :navigate  [{key}][SPACE][/]:select  [{key}][A][/]:all  [{key}][ENTER][/]:confirm  [{key}][BACKSPACE][/]:back  [{key}][Q][/]:quit[/]"
+        )
+        self._radio_hints = Text.from_markup(
+            f"[{primary}][{key}]⬆︎ /⬇︎[/] :navigate  [{key}][ENTER][/]:confirm  [{key}][BACKSPACE][/]:back  [{key}][Q][/]:quit[/]"
+        )
+        self._input_hints = Text.from_markup(
+            f"[{primary}][{key}][ENTER][/]:confirm  [{key}][\\Q][/]:quit[/]"
+        )
+        self._ask_again_hints = Text.from_markup(
+            f"[{primary}][{key}][ENTER][/]:try again  [{key}][Q][/]:quit[/]"
+        )
+
+    def _create_panel(self, content, title: Optional[str] = None, padding: Optional[tuple] = None, title_color: Optional[str] = "primary", **style_args) -> Panel:
+        """Create a styled panel with consistent settings."""
         if title:
-            kwargs["title"] = f"[{self.colors[title_color]}]\\[{title}][/ ]"
-            kwargs["title_align"] = "left"
+            style_args["title"] = self._panel_title(title, title_color)
+            style_args["title_align"] = "left"
         if padding:
-            kwargs["padding"] = padding
-        return Panel(content, **(kwargs | style_args))
+            style_args["padding"] = padding
+        return Panel(content, **(self._panel_kwargs | style_args))
 
-    def _create_hint_panel(self, hints: str) -> Panel:
+    def _panel_title(self, title: str, title_color: str) -> Text:
+        key = (title, title_color)
+        text = self._panel_titles.get(key)
+        if text is None:
+            text = self._panel_titles[key] = Text.from_markup(f"[{self.colors[title_color]}]\\[{title}][/ ]")
+        return text
+
+    def _prerendered_hint(self, hints: Text) -> _Prerendered:
+        return _Prerendered(self._create_hint_panel(hints))
+
+    def _create_hint_panel(self, hints: Text) -> Panel:
         """Create a panel for keyboard navigation hints."""
         return Panel(
-            f"[{self.colors['primary']}]{hints}[/]",
+            hints,
             border_style=f"dim {self.colors["subtle"]}",
             width=self.panel_width,
             box=HEAVY_HEAD,
         )
 
-    def _create_selection_table(self) -> Table:
-        """Create a pre-configured table for selection menus."""
-        table = Table(
-            show_header=False,
-            width=self.panel_width - 4,
-            show_edge=False,
-        )
-        table.add_column("option", style=self.colors["subtle"])
-        return table
+    def _input_before_next_frame(self) -> bool:
+        return self._keys_pending(max(0.0, self._next_frame_at - time.monotonic()))
+
+    def _menu_panel(self, title: str, row_count: int) -> tuple[list[Text], Panel]:
+        rows = [Text(style=self.colors["subtle"], overflow="ellipsis") for _ in range(row_count)]
+        body = Padding(Group(*rows), (0, 3, 0, 1))
+        return rows, self._create_panel(body, title=title, padding=(1, 0, 1, 0))
 
-    def _render_radio_row(self, is_current: bool, display_name: str, hint: str) -> str:
-        """Render a radio button row for selection menus."""
+    @staticmethod
+    def _fill_rows(rows: list[Text], lines: dict[int, Text]) -> None:
+        for index, line in lines.items():
+            row = rows[index]
+            row.plain = ""
+            row.append_text(line)
+
+    def _radio_rows(self, options: list) -> list[tuple[Text, Text]]:
+        key = tuple(options)
+        radio_rows = self._radio_row_cache.get(key)
+        if radio_rows is None:
+            primary, secondary = self._row_primary, self._row_secondary
+            radio_rows = self._radio_row_cache[key] = [
+                (
+                    Text.assemble(
+                        (CURSOR_MARKER, secondary), " ", ("●", secondary), " ",
+                        (option.display_name, secondary), " ", (option.display_hint, secondary),
+                    ),
+                    Text.assemble("  ○ ", (option.display_name, primary), " ", option.display_hint),
+                )
+                for option in options
+            ]
+        return radio_rows
+
+    def _file_row(self, is_current: bool, checked: bool, name: str, size: str) -> Text:
+        row = self._file_row_prefixes[is_current, checked].copy()
         if is_current:
-            marker = f"[{self.colors['secondary']}]►[/]"
-            radio = f"[{self.colors['secondary']}]●[/]"
-            text = f"[{self.colors['secondary']}]{display_name}[/] [{self.colors['secondary']}]{hint}[/]"
+            name_style = size_style = self._row_secondary
         else:
-            marker = " "
-            radio = "○"
-            text = f"[{self.colors['primary']}]{display_name}[/] {hint}"
-        return f"{marker} {radio} {text}"
+            name_style, size_style = self._row_primary, self._row_subtle
+        return row.append(name, style=name_style).append(" ").append(f"({size})", style=size_style)
 
     def _radio_select(self, options: list, title: str) -> ActionResult:
         """Generic radio-button selection menu.
@@ -202,57 +411,139 @@ class RetroCLI(UIInterface):
             Selected option from the list
         """
         current_index = 0
-        hints = f"[{self.colors['secondary']}]⬆︎ /⬇︎[/] :navigate  [{self.colors['secondary']}][ENTER][/]:confirm  [{self.colors['secondary']}][BACKSPACE][/]:back  [{self.colors['secondary']}][Q][/]:quit"
+        painted_index = None
+        radio_rows = self._radio_rows(options)
+        rows, panel = self._menu_panel(title, len(options))
         
-        while True:
-            self.clear_and_show_header()
-            table = self._create_selection_table()
-            for i, option in enumerate(options):
-                table.add_row(self._render_radio_row(
-                    i == current_index, 
-                    option.display_name, 
-                    option.display_hint
-                ))
-
-            self.print_center(self._create_panel(table, title=title, padding=(1, 0, 1, 0)))
-            self.print_center(self._create_hint_panel(hints))
-
-            token = self.keyboard_reader()
-
-            if token.key == KeyboardKey.BACKSPACE:
-                return ActionResult.back()
-
-            if token.key == KeyboardKey.CHAR and token.char == "q":
-                return ActionResult.terminate()
-
-            if token.key == KeyboardKey.UP:
-                current_index = (current_index - 1) % len(options)
-            elif token.key == KeyboardKey.DOWN:
-                current_index = (current_index + 1) % len(options)
-            elif token.key == KeyboardKey.ENTER:
-                return ActionResult.value(options[current_index])
+        with self._keyboard_session(), self._live_menu(panel, "_radio_hint_panel") as paint:
+            while True:
+                if current_index != painted_index and not self._input_before_next_frame():
+                    stale = range(len(options)) if painted_index is None else (painted_index, current_index)
+                    self._fill_rows(rows, {i: radio_rows[i][i != current_index] for i in stale})
+                    paint()
+                    painted_index = current_index
+
+                token = self.keyboard_reader()
+
+                while token is not None:
+                    if token.key == KeyboardKey.BACKSPACE:
+                        return ActionResult.back()
+
+                    if token.key == KeyboardKey.CHAR and token.char == "q":
+                        return ActionResult.terminate()
+
+                    if token.key == KeyboardKey.UP:
+                        current_index = (current_index - 1) % len(options)
+                    elif token.key == KeyboardKey.DOWN:
+                        current_index = (current_index + 1) % len(options)
+                    elif token.key == KeyboardKey.ENTER:
+                        return ActionResult.value(options[current_index])
+
+                    token = self.keyboard_reader() if self._keys_pending() else None
+
+    @contextmanager
+    def _live_menu(self, panel: Panel, hint: str):
+        self.clear_and_show_header()
+        live = self._start_menu_live()
+        body = None
+
+        def paint():
+            nonlocal live, body
+            if self._refresh_size():
+                live.stop()
+                self.clear_and_show_header()
+                live = self._start_menu_live()
+                body = None
+            if body is None:
+                panel.width = self.panel_width
+                body = self._indent(Group(panel, getattr(self, hint)))
+            with self._synchronized_output():
+                live.update(body, refresh=True)
+            self._next_frame_at = time.monotonic() + FRAME_INTERVAL
+
+        try:
+            yield paint
+        finally:
+            live.stop()
+
+    def _start_menu_live(self) -> Live:
+        live = Live(
+            console=self.console,
+            auto_refresh=False,
+            transient=True,
+            vertical_overflow="visible",
+            redirect_stdout=False,
+            redirect_stderr=False,
+        )
+        live.start()
+        return live
 
     def print_center(self, renderable):
         """Print a renderable centered within the configured console width."""
-        term_width = self.console.size.width
-        self.console.print(Align.center(renderable, width=term_width))
+        self._emit(self._indent(renderable))
+
+    def _indent(self, renderable) -> Padding:
+        return Padding(renderable, (0, 0, 0, self._left_pad), expand=False)
+
+    def _emit(self, renderable):
+        if self._frame_buffer is not None:
+            self._frame_buffer.append(renderable)
+            return
+        self.console.print(renderable)
+
+    @contextmanager
+    def _frame(self):
+        if self._frame_buffer is not None:
+            yield
+            return
+        self._frame_buffer = []
+        try:
+            yield
+            self._flush_frame()
+        finally:
+            self._frame_buffer = None
+            self._frame_clears = False
+
+    def _flush_frame(self) -> None:
+        if not self._frame_buffer:
+            return
+        frame = Group(*self._frame_buffer)
+        self._frame_buffer.clear()
+        if not self._frame_clears:
+            self.console.print(frame)
+            return
+        self._frame_clears = False
+        with self._synchronized_output(tail=ERASE_BELOW):
+            self.console.control(Control.home())
+            self.console.print(_Overwrite(frame))
+
+    @contextmanager
+    def _synchronized_output(self, tail: str = ""):
+        if not self.console.is_terminal:
+            yield
+            return
+        file = self.console.file
+        file.write(SYNC_BEGIN)
+        try:
+            with self.console:
+                yield
+        finally:
+            file.write(tail + SYNC_END)
+            file.flush()
 
     def input_center(self, prompt_symbol=">>", title = "", hint = ""):
-        left_padding = (self.console.size.width - self.panel_width) // 2 + 3
-        markup = (
-            f"[{self.colors['subtle']}]{hint}[/]\n\n"
-            f"[{self.colors['primary']}]{prompt_symbol}[/]"
-            )
-        self.print_center(self._create_panel(Text.from_markup(markup), title, padding=(1, 0, 0, 1)))
-
-        hints = f"[{self.colors['secondary']}][ENTER][/]:confirm  [{self.colors['secondary']}][\Q][/]:quit"
-        self.print_center(self._create_hint_panel(hints))
+        left_padding = self._left_pad + 3
+        content = Text.assemble((hint, self.colors['subtle']), "\n\n", (prompt_symbol, self.colors['primary']))
+        with self._frame():
+            self.print_center(self._create_panel(content, title, padding=(1, 0, 0, 1)))
+            self._emit(self._centered_input_hints)
+            self._flush_frame()
         
-        # Some Magic to hijack and reposition the blinking cursos
-        stdout.write("\033[5A") # More Magic: move up 6 lines. The hight of the hints panel + padding
-        stdout.write(f"\033[{len(prompt_symbol) + left_padding}C") # move left
+        # Some Magic to hijack and reposition the blinking cursos:
+        # move up past the hints panel + padding, then right to the prompt
+        stdout.write(f"\033[5A\033[{len(prompt_symbol) + left_padding}C")
         stdout.flush()
-        user_input = input("") 
+        user_input = self._line_reader() 
         stdout.write("\033[5B") # Move Down 5 (past bottom border), not to override the above
         stdout.flush()
         return user_input
@@ -260,48 +551,34 @@ class RetroCLI(UIInterface):
 
     def clear_and_show_header(self):
         """Clear screen and display header with breadcrumb navigation."""
-        self.console.clear()
-        self.draw_header()
-        self.draw_breadcrumb()
+        self._refresh_size()
+        with self._frame():
+            self._frame_clears = True
+            self.draw_header()
+            self.draw_breadcrumb()
 
     def draw_breadcrumb(self) -> None:
-        breadcrumb_text = Text()
-        last_index = len(self.breadcrumb) - 1
-        for i, label in enumerate(self.breadcrumb):
-            if i > 0:
-                breadcrumb_text.append(" >> ", style=self.colors["subtle"])
-            color = self.colors["secondary"] if i == last_index else self.colors["primary"]
-            breadcrumb_text.append(Text.from_markup(f"[{color}]{label}[/]"))
+        key = (tuple(self.breadcrumb), self._panel_width)
+        if key != self._breadcrumb_key:
+            self._breadcrumb_key = key
+            self._breadcrumb_panel = self._create_panel(
+                self._breadcrumb_text(key[0]), padding=(0, 0, 0, 0), box=MINIMAL
+            )
+        self.print_center(self._breadcrumb_panel)
 
-        self.print_center(self._create_panel(breadcrumb_text, padding=(0, 0, 0, 0), box=MINIMAL))
+    def _breadcrumb_text(self, labels: tuple) -> Text:
+        breadcrumb_text = Text()
+        if not labels:
+            return breadcrumb_text
+        *visited, current = labels
+        for label in visited:
+            breadcrumb_text.append(label, style=self.colors["primary"])
+            breadcrumb_text.append(" >> ", style=self.colors["subtle"])
+        breadcrumb_text.append(current, style=self.colors["secondary"])
+        return breadcrumb_text
 
     def draw_header(self):
-        ascii_logo = """
-    ██╗   ██╗███████╗██╗     ██╗     ██╗   ██╗███╗   ███╗
-    ██║   ██║██╔════╝██║     ██║     ██║   ██║████╗ ████║
-    ██║   ██║█████╗  ██║     ██║     ██║   ██║██╔████╔██║
-    ╚██╗ ██╔╝██╔══╝  ██║     ██║     ██║   ██║██║╚██╔╝██║
-     ╚████╔╝ ███████╗███████╗███████╗╚██████╔╝██║ ╚═╝ ██║
-      ╚═══╝  ╚══════╝╚══════╝╚══════╝ ╚═════╝ ╚═╝     ╚═╝
-        """
-        subtitle = f"[ epub | pdf -> txt ]"
-        logo_width = max(len(line) for line in ascii_logo.splitlines())
-        subtitle_width = len(subtitle) - 1
-        padding = (logo_width - subtitle_width) // 2
-
-        self.print_center(
-            Panel(
-                Align.center(
-                    Text(ascii_logo, style=self.colors["logo"]) + 
-                    Text("\n" + " ".ljust(padding) + subtitle.lower(), style=f"{self.colors['accented']}")
-                ),
-                border_style=f"dim {self.colors["subtle"]}",
-                width=self.panel_width,
-                box=HEAVY_HEAD,
-                subtitle=f"[not dim {self.colors['subtle']}]{self.VERSION}[/]",
-                subtitle_align="right",
-            )
-        )
+        self._emit(self._centered_header)
 
     def select_files(self, file_data: list[dict]) -> ActionResult[list[int]]:
         """Display file selector and return indices of selected files.
@@ -310,65 +587,70 @@ class RetroCLI(UIInterface):
             file_data: List of dicts with 'name' and 'size' keys
             
         Returns:
-            List of selected file indices
+            List of selected file indices; with no files or a lone file the menu is skipped
         """
-        selected_indices = []
+        if not file_data:
+            return ActionResult.value([])
+        if len(file_data) == 1:
+            return ActionResult.value([0])
+        selected_indices: set[int] = set()
         current_index = 0
-        hints = f"[{self.colors['secondary']}]⬆︎ /⬇︎[/] :navigate  [{self.colors['secondary']}][SPACE][/]:select  [{self.colors['secondary']}][A][/]:all  [{self.colors['secondary']}][ENTER][/]:confirm  [{self.colors['secondary']}][BACKSPACE][/]:back  [{self.colors['secondary']}][Q][/]:quit"
-        
-        while True:
-            self.clear_and_show_header()
-            table = self._create_selection_table()
-            
-            for i, file_info in enumerate(file_data):
-                checkbox = "✔" if i in selected_indices else "❏"
-                marker = f"[{self.colors['secondary']}]►[/]" if i == current_index else " "
-                
-                if i == current_index:
-                    checkbox_colored = f"[{self.colors['secondary']}]{checkbox}[/]"
-                    filename_text = f"[{self.colors['secondary']}]{file_info['name']}[/]"
-                    size_text = f"[{self.colors['secondary']}]({file_info['size']})[/]"
-                else:
-                    checkbox_colored = checkbox
-                    filename_text = f"[{self.colors['primary']}]{file_info['name']}[/]"
-                    size_text = f"[{self.colors['subtle']}]({file_info['size']})[/]"
-                table.add_row(f"{marker} {checkbox_colored} {filename_text} {size_text}")
-
-            self.print_center(self._create_panel(table, title="select files for conversion", padding=(1, 0, 1, 0)))
-            self.print_center(self._create_hint_panel(hints))
-
-            token = self.keyboard_reader()
-
-            if token.key == KeyboardKey.UP:
-                current_index = (current_index - 1) % len(file_data)
-            elif token.key == KeyboardKey.DOWN:
-                current_index = (current_index + 1) % len(file_data)
-            elif token.key == KeyboardKey.SPACE:
-                if current_index in selected_indices:
-                    selected_indices.remove(current_index)
-                else:
-                    selected_indices.append(current_index)
-            elif token.key == KeyboardKey.ENTER:
-                break
-            elif token.key == KeyboardKey.BACKSPACE:
-                return ActionResult.back()
-            elif token.key == KeyboardKey.CHAR and token.char == "a":
-                if len(selected_indices) == len(file_data):
-                    selected_indices = []
-                else:
-                    selected_indices = list(range(len(file_data)))
-            elif token.key == KeyboardKey.CHAR and token.char == "q":
-                return ActionResult.terminate()
-
-        self.clear_and_show_header()
-
-        return ActionResult.value(selected_indices)
+        stale = set(range(len(file_data)))
+        row_texts: dict[tuple[int, bool, bool], Text] = {}
+        rows, panel = self._menu_panel("select files for conversion", len(file_data))
+
+        with self._keyboard_session(), self._live_menu(panel, "_file_select_hint_panel") as paint:
+            while True:
+                if stale and not self._input_before_next_frame():
+                    lines = {}
+                    for i in stale:
+                        key = (i, i == current_index, i in selected_indices)
+                        if key not in row_texts:
+                            row_texts[key] = self._file_row(key[1], key[2], file_data[i]['name'], file_data[i]['size'])
+                        lines[i] = row_texts[key]
+                    self._fill_rows(rows, lines)
+                    paint()
+                    stale.clear()
+
+                token = self.keyboard_reader()
+
+                while token is not None:
+                    if token.key == KeyboardKey.UP:
+                        new_index = (current_index - 1) % len(file_data)
+                        if new_index != current_index:
+                            stale.update((current_index, new_index))
+                        current_index = new_index
+                    elif token.key == KeyboardKey.DOWN:
+                        new_index = (current_index + 1) % len(file_data)
+                        if new_index != current_index:
+                            stale.update((current_index, new_index))
+                        current_index = new_index
+                    elif token.key == KeyboardKey.SPACE:
+                        if current_index in selected_indices:
+                            selected_indices.discard(current_index)
+                        else:
+                            selected_indices.add(current_index)
+                        stale.add(current_index)
+                    elif token.key == KeyboardKey.ENTER:
+                        return ActionResult.value(sorted(selected_indices))
+                    elif token.key == KeyboardKey.BACKSPACE:
+                        return ActionResult.back()
+                    elif token.key == KeyboardKey.CHAR and token.char == "a":
+                        if len(selected_indices) == len(file_data):
+                            selected_indices = set()
+                        else:
+                            selected_indices = set(range(len(file_data)))
+                        stale.update(range(len(file_data)))
+                    elif token.key == KeyboardKey.CHAR and token.char == "q":
+                        return ActionResult.terminate()
+
+                    token = self.keyboard_reader() if self._keys_pending() else None
 
     def get_path_input(self) -> ActionResult[str]:
         """Get path input from user."""
-        self.clear_and_show_header()
-        
-        result = self.input_center(title="select input source", hint="e.g. source.pdf or /data")
+        with self._frame():
+            self.clear_and_show_header()
+            result = self.input_center(title="select input source", hint="e.g. source.pdf or /data")
         if result.strip().lower() == "\\q":
             return ActionResult.terminate()
         return ActionResult.value(result)
@@ -389,47 +671,56 @@ class RetroCLI(UIInterface):
 
     def prompt_merged_filename(self) -> ActionResult[str]:
         """Prompt user for the name of the merged output file."""
-        self.clear_and_show_header()
-        
-        result = self.input_center(title="select merged output", hint="output file name without extension")
+        with self._frame():
+            self.clear_and_show_header()
+            result = self.input_center(title="select merged output", hint="output file name without extension")
         if result.strip().lower() == "\\q":
             return ActionResult.terminate()
         return ActionResult.value(result.strip())
 
+    @cached_property
+    def _progress_columns(self) -> tuple:
+        return (
+            SpinnerColumn(
+                speed=.75,
+                style=self.colors["accented"]
+            ),
+            StyledDescriptionColumn(self.colors),
+            BarColumn(
+                bar_width=None,
+                style=self.colors["subtle"],
+                complete_style=self.colors["accented"],
+                finished_style=self.colors["subtle"],
+            ),
+            StyledPercentageColumn(self.colors),
+            StyledTimeElapsedColumn(self.colors["accented"]),
+        )
+
     def get_progress_bar(self):
         self.clear_and_show_header()
         @contextmanager
         def _progress_ctx():
             progress = Progress(
-                SpinnerColumn(
-                    speed=.75,
-                    style=self.colors["accented"]
-                ),
-                StyledDescriptionColumn(self.colors),
-                BarColumn(
-                    bar_width=None,
-                    style=self.colors["subtle"],
-                    complete_style=self.colors["accented"],
-                    finished_style=self.colors["subtle"],
-                ),
-                StyledPercentageColumn(self.colors),
-                StyledTimeElapsedColumn(self.colors["accented"]),
+                *self._progress_columns,
                 console=self.console,
                 transient=True,
             )
 
             panel = self._create_panel(progress, title="selected files", padding=(1, 0, 1, 0))
-            term_width = self.console.size.width
-            centered = Align.center(panel, width=term_width)
-            with Live(centered, console=self.console, refresh_per_second=10):
-                yield progress
+            centered = self._indent(panel)
+            try:
+                with Live(centered, console=self.console, refresh_per_second=self.progress_refresh_per_second):
+                    yield progress
+            finally:
+                for column in self._progress_columns:
+                    if isinstance(column, (StyledDescriptionColumn, StyledPercentageColumn, StyledTimeElapsedColumn)):
+                        column.reset()
 
         return _progress_ctx()
 
     def show_error(self, message: str):
         markup = f"[{self.colors['error']}]" + message + "[/]"
-        term_width = self.console.size.width
-        left_padding = (term_width - self.panel_width) // 2 + 1
+        left_padding = self._left_pad + 1
         self.console.print(" " * left_padding + markup, markup=True)
 
     def show_conversion_summary(
@@ -456,23 +747,25 @@ class RetroCLI(UIInterface):
         else:  # no_merge
             output_desc = single_output_filename if single_output_filename else f"{output_count} files"
         
-        content = (
-            f"[{self.colors['primary']}]files processed:{'':<4}[/] [{self.colors['secondary']}]{total_files}[/]\n"
-            f"[{self.colors['primary']}]output created:{'':<5}[/] [{self.colors['secondary']}]{output_desc}[/]\n"
-            f"[{self.colors['primary']}]input size:{'':<9}[/] [{self.colors['secondary']}]{total_input_size_formatted}[/]\n"
-            f"[{self.colors['primary']}]output size:{'':<8}[/] [{self.colors['secondary']}]{total_output_size_formatted}[/]\n\n"
-            f"[{self.colors['accented']}]total runtime:{'':<6} {runtime_str}[/]"
-        )
+        content = Text()
+        for label, value in (
+            ("files processed:", total_files),
+            ("output created:", output_desc),
+            ("input size:", total_input_size_formatted),
+            ("output size:", total_output_size_formatted),
+        ):
+            content.append(f"{label:<20}", style=self.colors["primary"]).append(" ")
+            content.append(str(value), style=self.colors["secondary"]).append("\n")
+        content.append(f"\n{'total runtime:':<20} {runtime_str}", style=self.colors["accented"])
         
         self.print_center(self._create_panel(
-            Text.from_markup(content), 
+            content, 
             title="conversion complete", 
             padding=(1, 0, 1, 1),
         ))
 
     def ask_again(self) -> ActionResult[bool]:
-        hints = f"[{self.colors['secondary']}][ENTER][/]:try again  [{self.colors['secondary']}][Q][/]:quit"
-        self.print_center(self._create_hint_panel(hints))
+        self._emit(self._centered_ask_again_hints)
         while True:
             token = self.keyboard_reader()
             if token.key == KeyboardKey.ENTER: